@@ -0,0 +1,243 @@
+import asyncio
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Any, Callable, List
+
+from rich.table import Table
+
+from benchmarks.imports import ImportResult, measure_import
+from benchmarks.payloads import generate_payload, generate_roster
+from benchmarks.server import StubServer
+from neptunes_hooks.console import CONSOLE
+from neptunes_hooks.renderers import RENDERERS, Renderer, build_reports
+from neptunes_hooks.services._base import create_session
+from neptunes_hooks.services.aio import AsyncNeptunesPride, create_async_client
+from neptunes_hooks.services.microsoft_teams import MicrosoftTeams
+from neptunes_hooks.services.neptunes_pride import NeptunesPride, parse_stats, project_payload
+from neptunes_hooks.utils import (
+    build_leaderboards,
+    parse_player_stats,
+    parse_team_stats,
+    rank_player_stats,
+    rank_team_stats,
+)
+
+
+@dataclass
+class Result:
+    name: str
+    calls: int
+    mean_ms: float
+    best_ms: float
+    per_second: float
+    peak_kib: float
+
+
+def get_arguments() -> Namespace:
+    parser = ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--players", type=int, default=32)
+    parser.add_argument("--teams", type=int, default=4)
+    parser.add_argument("--ticks", type=int, default=100)
+    parser.add_argument("--stars", type=int, default=1000)
+    parser.add_argument("--fleets", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument(
+        "--import-budget",
+        type=float,
+        default=None,
+        help="Only check imports, failing if `neptunes_hooks` takes longer (ms) or loads any "
+        "heavy dependencies",
+    )
+    return parser.parse_args()
+
+
+def measure(name: str, func: Callable[[], Any], repeat: int, units: int = 1) -> Result:
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    mean = sum(timings) / len(timings)
+    return Result(
+        name=name,
+        calls=repeat,
+        mean_ms=mean * 1000,
+        best_ms=min(timings) * 1000,
+        per_second=units / mean if mean else 0.0,
+        peak_kib=peak / 1024,
+    )
+
+
+def run(args: Namespace) -> List[Result]:
+    payload = generate_payload(
+        players=args.players,
+        stars=args.stars,
+        fleets=args.fleets,
+        seed=args.seed,
+    )
+    roster = generate_roster(players=args.players, teams=args.teams)
+    stats = parse_stats(project_payload(payload))
+    player_stats = parse_player_stats(stats, roster)
+    team_stats = parse_team_stats(stats, roster)
+    history = [
+        parse_stats(project_payload(generate_payload(players=args.players, tick=x, stars=0)))
+        for x in range(args.ticks)
+    ]
+    session = create_session()
+    loop = asyncio.new_event_loop()
+    client = create_async_client()
+
+    with StubServer(payload=payload) as server:
+
+        def pull_data() -> None:
+            neptunes_pride = NeptunesPride(game_number=1, code="benchmark", session=session)
+            neptunes_pride.url = f"{server.url}/api"
+            neptunes_pride.pull_data()
+
+        def async_pull_data() -> None:
+            neptunes_pride = AsyncNeptunesPride(game_number=1, code="benchmark", client=client)
+            neptunes_pride.url = f"{server.url}/api"
+            loop.run_until_complete(neptunes_pride.pull_data())
+
+        def push_data() -> None:
+            MicrosoftTeams(url=f"{server.url}/webhook", session=session).push_data(
+                player_stats=player_stats,
+                team_stats=team_stats,
+                turn=2,
+                game_name=stats.title,
+            )
+
+        reports = build_reports(player_stats, team_stats, turn=2, game_name=stats.title)
+
+        def encode(renderer: Renderer) -> None:
+            for report in reports.values():
+                renderer.encode(report)
+
+        def replay() -> None:
+            for tick_stats in history:
+                parse_player_stats(tick_stats, roster)
+                parse_team_stats(tick_stats, roster)
+
+        try:
+            return [
+                measure("NeptunesPride.pull_data", pull_data, args.repeat),
+                measure("AsyncNeptunesPride.pull_data", async_pull_data, args.repeat),
+                measure("parse_stats", lambda: parse_stats(project_payload(payload)), args.repeat),
+                measure(
+                    "parse_player_stats",
+                    lambda: parse_player_stats(stats, roster),
+                    args.repeat,
+                ),
+                measure("parse_team_stats", lambda: parse_team_stats(stats, roster), args.repeat),
+                measure("rank_player_stats", lambda: rank_player_stats(stats, roster), args.repeat),
+                measure("rank_team_stats", lambda: rank_team_stats(stats, roster), args.repeat),
+                measure(
+                    "build_leaderboards",
+                    lambda: build_leaderboards(stats, roster),
+                    args.repeat,
+                ),
+                measure(
+                    "build_reports",
+                    lambda: build_reports(player_stats, team_stats, turn=2, game_name=stats.title),
+                    args.repeat,
+                ),
+                *(
+                    measure(f"{name}.encode", partial(encode, renderer), args.repeat, len(reports))
+                    for name, renderer in RENDERERS.items()
+                ),
+                measure("MicrosoftTeams.push_data", push_data, args.repeat),
+                measure(
+                    f"replay ({args.ticks} ticks)",
+                    replay,
+                    max(1, args.repeat // 10),
+                    args.ticks,
+                ),
+            ]
+        finally:
+            loop.run_until_complete(client.aclose())
+            loop.close()
+
+
+def check_imports(args: Namespace) -> None:
+    results: List[ImportResult] = [
+        measure_import("neptunes_hooks"),
+        measure_import("neptunes_hooks.__main__"),
+    ]
+    failed = [x for x in results if x.best_ms > args.import_budget or x.loaded]
+    if args.json:
+        CONSOLE.print_json(
+            json.dumps({"arguments": vars(args), "imports": [asdict(x) for x in results]}),
+        )
+    else:
+        table = Table(
+            title=f"Import budget: {args.import_budget:,.1f} ms",
+            title_style="title",
+            border_style="title.border",
+        )
+        table.add_column("Module")
+        table.add_column("Best (ms)", justify="right")
+        table.add_column("Heavy dependencies")
+        for result in results:
+            table.add_row(result.module, f"{result.best_ms:,.3f}", ", ".join(result.loaded))
+        CONSOLE.print(table)
+    if failed:
+        modules = ", ".join(f"`{x.module}`" for x in failed)
+        CONSOLE.print(f"[bold red]{modules} over the import budget[/]")
+        sys.exit(1)
+
+
+def main() -> None:
+    args = get_arguments()
+    if args.import_budget is not None:
+        check_imports(args)
+        return
+    results = run(args)
+    if args.json:
+        CONSOLE.print_json(
+            json.dumps({"arguments": vars(args), "results": [asdict(x) for x in results]}),
+        )
+        return
+
+    table = Table(
+        title=f"{args.players} players, {args.teams} teams, {args.stars} stars",
+        title_style="title",
+        border_style="title.border",
+    )
+    table.add_column("Stage")
+    table.add_column("Calls", justify="right")
+    table.add_column("Mean (ms)", justify="right")
+    table.add_column("Best (ms)", justify="right")
+    table.add_column("Per second", justify="right")
+    table.add_column("Peak (KiB)", justify="right")
+    for result in results:
+        table.add_row(
+            result.name,
+            str(result.calls),
+            f"{result.mean_ms:,.3f}",
+            f"{result.best_ms:,.3f}",
+            f"{result.per_second:,.1f}",
+            f"{result.peak_kib:,.1f}",
+        )
+    CONSOLE.print(table)
+
+
+if __name__ == "__main__":
+    main()
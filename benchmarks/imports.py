@@ -0,0 +1,48 @@
+__all__ = ["LAZY_MODULES", "ImportResult", "measure_import"]
+
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List
+
+LAZY_MODULES = [
+    "rich",
+    "pydantic",
+    "requests",
+    "ijson",
+    "tomli_w",
+    "http.server",
+    "asyncio",
+    "httpx",
+]
+IMPORT_TIME = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\S+)$")
+
+
+@dataclass
+class ImportResult:
+    module: str
+    best_ms: float
+    loaded: List[str]
+
+
+def measure_import(module: str, repeat: int = 5) -> ImportResult:
+    script = (
+        f"import sys, {module}; "
+        f"print(','.join(x for x in {LAZY_MODULES!r} if x in sys.modules))"
+    )
+    timings = []
+    loaded = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", script],  # noqa: S603
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        for line in process.stderr.splitlines():
+            match = IMPORT_TIME.match(line)
+            if match and match.group(2) == module:
+                timings.append(int(match.group(1)) / 1000)
+        loaded = [x for x in process.stdout.strip().split(",") if x]
+    return ImportResult(module=module, best_ms=min(timings), loaded=loaded)
@@ -0,0 +1,66 @@
+__all__ = ["generate_payload", "generate_roster"]
+
+import random
+from typing import Any, Dict, List
+
+from neptunes_hooks.settings import PlayerSettings
+
+TECH_NAMES = [
+    "scanning",
+    "propulsion",
+    "terraforming",
+    "research",
+    "weapons",
+    "banking",
+    "manufacturing",
+]
+
+
+def _generate_player(index: int, tick: int, rng: random.Random) -> Dict[str, Any]:
+    growth = tick + 1
+    return {
+        "alias": f"Player {index:03}",
+        "conceded": 0 if rng.random() > 0.05 else 1,
+        "total_stars": rng.randint(1, 10) * growth,
+        "total_strength": rng.randint(10, 100) * growth,
+        "total_economy": rng.randint(1, 10) * growth,
+        "total_industry": rng.randint(1, 10) * growth,
+        "total_science": rng.randint(1, 5) * growth,
+        "tech": {
+            x: {"level": rng.randint(1, 3) + tick // 24, "value": rng.random()} for x in TECH_NAMES
+        },
+    }
+
+
+def generate_payload(
+    players: int = 32,
+    tick: int = 24,
+    stars: int = 1000,
+    fleets: int = 500,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    rng = random.Random(seed * 100_000 + tick)
+    return {
+        "name": "Benchmark Galaxy",
+        "tick": tick,
+        "tick_fragment": 0.5,
+        "tick_rate": 60,
+        "paused": False,
+        "game_over": 0,
+        "players": {str(x): _generate_player(x, tick, rng) for x in range(players)},
+        "stars": {
+            str(x): {"uid": x, "n": f"Star {x}", "x": rng.random(), "y": rng.random(), "st": 10}
+            for x in range(stars)
+        },
+        "fleets": {
+            str(x): {"uid": x, "n": f"Fleet {x}", "x": rng.random(), "y": rng.random(), "st": 5}
+            for x in range(fleets)
+        },
+    }
+
+
+def generate_roster(players: int = 32, teams: int = 4) -> List[PlayerSettings]:
+    return [
+        PlayerSettings(username=f"Player {x:03}", name=f"Name {x}", team=f"Team {x % teams}")
+        for x in range(players)
+    ]
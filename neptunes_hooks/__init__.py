@@ -8,15 +8,18 @@
 ]
 __version__ = "2.3.0"
 
+import atexit
+import copy
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from queue import SimpleQueue
 
-from rich.logging import RichHandler
-from rich.traceback import install
-
-from neptunes_hooks.console import CONSOLE
+LOG_FORMAT = "[%(asctime)s] [%(levelname)-8s] {%(name)s} | %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 def get_cache_root() -> Path:
@@ -44,29 +47,88 @@ def get_project_root() -> Path:
     return Path(__file__).parent.parent
 
 
-def setup_logging(debug: bool = False) -> None:
+class _JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        content = {
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            record.exc_text = record.exc_text or self.formatException(record.exc_info)
+        if record.exc_text:
+            content["exception"] = record.exc_text
+        return json.dumps(content)
+
+
+class _QueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(
+                record.exc_info,
+            )
+            record.exc_info = None
+        return record
+
+
+def setup_logging(debug: bool = False, queue: bool = False) -> None:
+    from rich.logging import RichHandler
+    from rich.traceback import install
+
+    from neptunes_hooks.console import CONSOLE
+
     install(show_locals=True, max_frames=5, console=CONSOLE)
-    log_folder = get_project_root() / "logs"
+    log_folder = get_data_root() / "logs"
     log_folder.mkdir(parents=True, exist_ok=True)
+    level = logging.DEBUG if debug else logging.INFO
+
+    if not queue:
+        logging.basicConfig(
+            force=True,
+            format=LOG_FORMAT,
+            datefmt=LOG_DATE_FORMAT,
+            level=level,
+            handlers=[
+                RichHandler(
+                    rich_tracebacks=True,
+                    tracebacks_show_locals=True,
+                    omit_repeated_times=False,
+                    show_level=False,
+                    show_time=False,
+                    show_path=False,
+                    console=CONSOLE,
+                ),
+                RotatingFileHandler(
+                    filename=log_folder / "neptunes-hooks.log",
+                    maxBytes=100000000,
+                    backupCount=3,
+                ),
+            ],
+        )
+        return
 
-    logging.basicConfig(
-        format="[%(asctime)s] [%(levelname)-8s] {%(name)s} | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        level=logging.DEBUG if debug else logging.INFO,
-        handlers=[
-            RichHandler(
-                rich_tracebacks=True,
-                tracebacks_show_locals=True,
-                omit_repeated_times=False,
-                show_level=False,
-                show_time=False,
-                show_path=False,
-                console=CONSOLE,
-            ),
-            RotatingFileHandler(
-                filename=log_folder / "neptunes-hooks.log",
-                maxBytes=100000000,
-                backupCount=3,
-            ),
-        ],
+    console_handler = RichHandler(
+        omit_repeated_times=False,
+        show_level=False,
+        show_time=False,
+        show_path=False,
+        console=CONSOLE,
     )
+    console_handler.setFormatter(logging.Formatter(fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+    file_handler = RotatingFileHandler(
+        filename=log_folder / "neptunes-hooks.jsonl",
+        maxBytes=100000000,
+        backupCount=3,
+    )
+    file_handler.setFormatter(_JsonFormatter())
+
+    log_queue = SimpleQueue()
+    listener = QueueListener(log_queue, console_handler, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    logging.basicConfig(force=True, level=level, handlers=[_QueueHandler(log_queue)])
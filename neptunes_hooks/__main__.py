@@ -1,72 +1,85 @@
 import logging
-import time
+import os
 from argparse import ArgumentParser, Namespace
+from pathlib import Path
 
 from neptunes_hooks import setup_logging
-from neptunes_hooks.services.microsoft_teams import MicrosoftTeams
-from neptunes_hooks.services.neptunes_pride import NeptunesPride
-from neptunes_hooks.settings import PlayerSettings, Settings
-from neptunes_hooks.utils import parse_player_stats, parse_team_stats
 
 LOGGER = logging.getLogger(__name__)
-SETTINGS = Settings()
 
 
 def get_arguments() -> Namespace:
     parser = ArgumentParser()
     parser.add_argument("-p", "--poll", nargs="?", const=30, type=int, default=30)
+    parser.add_argument("-w", "--workers", type=int, default=8)
     parser.add_argument("--debug", action="store_true")
+    parser.add_argument("--once", action="store_true")
+    parser.add_argument("--offline", action="store_true")
+    parser.add_argument("--metrics-port", type=int, default=None)
+    parser.add_argument("--stats-port", type=int, default=None)
+    parser.add_argument("--log-queue", action="store_true")
+    parser.add_argument("--supervise", action="store_true")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    subparsers = parser.add_subparsers(dest="command")
+    backfill = subparsers.add_parser(
+        "backfill",
+        help="Replay saved API snapshots or recorded history into a leaderboard timeline",
+    )
+    backfill.add_argument(
+        "source",
+        nargs="?",
+        type=Path,
+        default=None,
+        help="Folder, zip or tar of saved API snapshots (defaults to the response cache)",
+    )
+    backfill.add_argument("--history", type=int, default=None, metavar="GAME_NUMBER")
+    backfill.add_argument("-o", "--output", type=Path, required=True)
+    backfill.add_argument("-f", "--format", choices=["csv", "jsonl", "parquet"], default="jsonl")
+    backfill.add_argument("-w", "--workers", type=int, default=None)
+    backfill.add_argument("--chunk-size", type=int, default=50)
     return parser.parse_args()
 
 
-def main() -> None:
-    args = get_arguments()
-    setup_logging(debug=args.debug)
-
-    LOGGER.info("Welcome to Neptune's Pride")
-    neptunes_pride = NeptunesPride(
-        game_number=SETTINGS.neptunes_pride.game_number,
-        code=SETTINGS.neptunes_pride.api_code,
+def run_backfill(args: Namespace) -> None:
+    from neptunes_hooks.backfill import backfill, write_timeline
+    from neptunes_hooks.history import HistoryStore
+    from neptunes_hooks.services.cache import ResponseCache
+    from neptunes_hooks.settings import Settings
+
+    if args.history is not None:
+        source = None
+        history = HistoryStore(game_number=args.history)
+    else:
+        source = args.source or ResponseCache().folder
+        history = None
+        if not source.exists():
+            LOGGER.fatal(f"`{source}` doesn't exist, closing down.")
+            return
+    chunks = backfill(
+        players=Settings().players,
+        source=source,
+        history=history,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
     )
-
-    microsoft_teams = None
-    if SETTINGS.webhooks.microsoft_teams:
-        microsoft_teams = MicrosoftTeams(url=SETTINGS.webhooks.microsoft_teams)
-
-    if not microsoft_teams:
-        LOGGER.fatal("No webhooks were specified, closing down.")
+    try:
+        count = write_timeline(chunks=chunks, output=args.output, fmt=args.format)
+    except ValueError as err:
+        LOGGER.fatal(f"{err}, closing down.")
         return
+    LOGGER.info(f"Wrote {count:,} timeline rows to `{args.output}`")
 
-    response = neptunes_pride.pull_data()
-    while response and response.active:
-        players = [x.username for x in response.players if x.username]
-        for new_player in players:
-            if new_player not in [x.username for x in SETTINGS.players]:
-                SETTINGS.players.append(PlayerSettings(username=new_player))
-                SETTINGS.save()
-
-        if response.tick > SETTINGS.last_tick or args.debug:
-            turn = int(response.tick / SETTINGS.neptunes_pride.tick_rate)
-            LOGGER.info(f"Turn {turn:02}")
 
-            player_stats = parse_player_stats(response, SETTINGS.players)
-            team_stats = parse_team_stats(response, SETTINGS.players)
+def main() -> None:
+    args = get_arguments()
+    setup_logging(debug=args.debug, queue=args.log_queue)
+    if args.command == "backfill":
+        run_backfill(args=args)
+        return
 
-            if microsoft_teams:
-                microsoft_teams.push_data(
-                    player_stats=player_stats,
-                    team_stats=team_stats,
-                    turn=turn,
-                    game_name=response.title,
-                )
+    from neptunes_hooks.runner import start
 
-            SETTINGS.neptunes_pride.last_tick = response.tick
-            SETTINGS.save()
-            LOGGER.debug("Waiting for next turn...")
-        if args.debug:
-            break
-        time.sleep(args.poll * 60)
-        response = neptunes_pride.pull_data()
+    start(args=args)
 
 
 if __name__ == "__main__":
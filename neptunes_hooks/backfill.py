@@ -0,0 +1,196 @@
+__all__ = ["TIMELINE_FIELDS", "backfill", "snapshot_names", "timeline_rows", "write_timeline"]
+
+import csv
+import json
+import logging
+import tarfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path, PurePosixPath
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from neptunes_hooks.history import HistoryStore
+from neptunes_hooks.models import Stats
+from neptunes_hooks.services.neptunes_pride import load_payload, parse_stats
+from neptunes_hooks.settings import PlayerSettings
+from neptunes_hooks.utils import STAT_NAMES, parse_player_stats, parse_team_stats
+
+LOGGER = logging.getLogger(__name__)
+TIMELINE_FIELDS = ["game", "title", "tick", "kind", "stat", "label", "leaders"]
+
+
+def snapshot_names(source: Path) -> List[str]:
+    if source.is_dir():
+        return sorted(x.relative_to(source).as_posix() for x in source.rglob("*.json"))
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            return sorted(x for x in archive.namelist() if x.endswith(".json"))
+    if tarfile.is_tarfile(source):
+        with tarfile.open(source) as archive:
+            return sorted(
+                x.name for x in archive.getmembers() if x.isfile() and x.name.endswith(".json")
+            )
+    return [""]
+
+
+def _opener(source: Path, stack: ExitStack) -> Callable[[str], IO[bytes]]:
+    if source.is_dir():
+        return lambda name: stack.enter_context((source / name).open("rb"))
+    if zipfile.is_zipfile(source):
+        archive = stack.enter_context(zipfile.ZipFile(source))
+        return lambda name: stack.enter_context(archive.open(name))
+    if tarfile.is_tarfile(source):
+        archive = stack.enter_context(tarfile.open(source))
+        return lambda name: stack.enter_context(archive.extractfile(name))
+    return lambda _: stack.enter_context(source.open("rb"))
+
+
+def _game_number(source: Path, name: str) -> Optional[int]:
+    folder = PurePosixPath(name).parent.name if name else source.parent.name
+    return int(folder) if folder.isdigit() else None
+
+
+def timeline_rows(
+    stats: Stats,
+    players: List[PlayerSettings],
+    game_number: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    rows = []
+    for kind, result in (
+        ("player", parse_player_stats(stats, players)),
+        ("team", parse_team_stats(stats, players)),
+    ):
+        if not result:
+            continue
+        leaders, overall = result
+        for stat, (label, names) in zip(STAT_NAMES, leaders.items()):
+            rows.append(
+                {
+                    "game": game_number,
+                    "title": stats.title,
+                    "tick": stats.tick,
+                    "kind": kind,
+                    "stat": stat,
+                    "label": label,
+                    "leaders": ", ".join(sorted(names)),
+                },
+            )
+        rows.append(
+            {
+                "game": game_number,
+                "title": stats.title,
+                "tick": stats.tick,
+                "kind": kind,
+                "stat": "overall",
+                "label": "overall",
+                "leaders": ", ".join(overall),
+            },
+        )
+    return rows
+
+
+def _process_snapshots(
+    source: Path,
+    names: List[str],
+    roster: List[Dict[str, str]],
+) -> List[Dict[str, Any]]:
+    players = [PlayerSettings(**x) for x in roster]
+    rows = []
+    with ExitStack() as stack:
+        open_snapshot = _opener(source, stack)
+        for name in names:
+            try:
+                stats = parse_stats(load_payload(open_snapshot(name)))
+            except (KeyError, TypeError, ValueError) as err:
+                LOGGER.warning(f"Skipping unreadable snapshot `{name or source}`: {err}")
+                continue
+            rows.extend(timeline_rows(stats, players, game_number=_game_number(source, name)))
+    return rows
+
+
+def _process_history(
+    folder: Path,
+    game_number: int,
+    ticks: List[int],
+    roster: List[Dict[str, str]],
+) -> List[Dict[str, Any]]:
+    history = HistoryStore(game_number=game_number, folder=folder)
+    players = [PlayerSettings(**x) for x in roster]
+    rows = []
+    for stats in filter(None, map(history.load, ticks)):
+        rows.extend(timeline_rows(stats, players, game_number=game_number))
+    return rows
+
+
+def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    for index in range(0, len(items), size):
+        yield items[index : index + size]
+
+
+def backfill(
+    players: List[PlayerSettings],
+    source: Optional[Path] = None,
+    history: Optional[HistoryStore] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 50,
+) -> Iterator[List[Dict[str, Any]]]:
+    roster = [x.dict() for x in players]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if history is not None:
+            ticks = history.ticks()
+            LOGGER.info(f"Replaying {len(ticks):,} ticks of game {history.game_number}")
+            chunks = list(_chunks(ticks, chunk_size))
+            yield from executor.map(
+                _process_history,
+                [history.folder.parent] * len(chunks),
+                [history.game_number] * len(chunks),
+                chunks,
+                [roster] * len(chunks),
+            )
+            return
+
+        names = snapshot_names(source)
+        LOGGER.info(f"Replaying {len(names):,} snapshots from `{source}`")
+        chunks = list(_chunks(names, chunk_size))
+        yield from executor.map(
+            _process_snapshots,
+            [source] * len(chunks),
+            chunks,
+            [roster] * len(chunks),
+        )
+
+
+def _write_parquet(chunks: Iterable[List[Dict[str, Any]]], output: Path) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ModuleNotFoundError as err:
+        raise ValueError("Parquet output requires `pip install .[parquet]`") from err
+
+    schema = pa.schema(
+        [(x, pa.int64() if x in ("game", "tick") else pa.string()) for x in TIMELINE_FIELDS],
+    )
+    count = 0
+    with pq.ParquetWriter(output, schema) as writer:
+        for rows in chunks:
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            count += len(rows)
+    return count
+
+
+def write_timeline(chunks: Iterable[List[Dict[str, Any]]], output: Path, fmt: str) -> int:
+    if fmt == "parquet":
+        return _write_parquet(chunks=chunks, output=output)
+    count = 0
+    with output.open("w", encoding="UTF-8", newline="") as stream:
+        writer = csv.DictWriter(stream, fieldnames=TIMELINE_FIELDS) if fmt == "csv" else None
+        if writer:
+            writer.writeheader()
+        for rows in chunks:
+            if writer:
+                writer.writerows(rows)
+            else:
+                stream.writelines(json.dumps(x) + "\n" for x in rows)
+            count += len(rows)
+    return count
@@ -0,0 +1,116 @@
+__all__ = ["DeltaEngine"]
+
+import logging
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple
+
+from neptunes_hooks.models import Delta, PlayerStats, Stats, TeamStats
+from neptunes_hooks.utils import STAT_NAMES
+
+LOGGER = logging.getLogger(__name__)
+Row = Tuple[int, ...]
+Leaders = Dict[str, Set[str]]
+
+
+def _row(stats: object) -> Row:
+    return tuple(getattr(stats, x) for x in STAT_NAMES)
+
+
+def _diff_rows(previous: Dict[str, Row], current: Dict[str, Row]) -> Dict[str, Dict[str, int]]:
+    changes = {}
+    for name, row in current.items():
+        old_row = previous.get(name)
+        if old_row is None or old_row == row:
+            continue
+        changes[name] = {
+            stat: new - old for stat, old, new in zip(STAT_NAMES, old_row, row) if new != old
+        }
+    return changes
+
+
+def _leaders(
+    rows: Dict[str, Row],
+    active: Set[str],
+    previous: Optional[Leaders] = None,
+    changes: Optional[Dict[str, Dict[str, int]]] = None,
+) -> Leaders:
+    changed_stats = {stat for x in (changes or {}).values() for stat in x}
+    leaders = {}
+    for index, stat in enumerate(STAT_NAMES):
+        if previous is not None and stat not in changed_stats:
+            leaders[stat] = previous[stat]
+            continue
+        values = {name: row[index] for name, row in rows.items() if name in active}
+        max_value = max(values.values(), default=-1)
+        leaders[stat] = {name for name, value in values.items() if value == max_value}
+    return leaders
+
+
+def _diff_leaders(previous: Optional[Leaders], current: Leaders) -> Dict[str, List[str]]:
+    if previous is None:
+        return {}
+    return {stat: sorted(names) for stat, names in current.items() if names != previous.get(stat)}
+
+
+class _Snapshot:
+    def __init__(self, players: List[PlayerStats], teams: List[TeamStats]):
+        self.players = {x.username: _row(x) for x in players}
+        self.active_players = {x.username for x in players if x.active}
+        self.teams = {x.name: _row(x) for x in teams}
+        self.active_teams = {x.name for x in teams if x.active}
+        self.player_leaders: Optional[Leaders] = None
+        self.team_leaders: Optional[Leaders] = None
+
+
+class DeltaEngine:
+    def __init__(self):
+        self._snapshots: Dict[int, _Snapshot] = {}
+        self._lock = Lock()
+
+    def seed(self, game_number: int, stats: Optional[Stats], teams: List[TeamStats]) -> None:
+        if not stats:
+            return
+        snapshot = _Snapshot(players=stats.players, teams=teams)
+        snapshot.player_leaders = _leaders(snapshot.players, snapshot.active_players)
+        snapshot.team_leaders = _leaders(snapshot.teams, snapshot.active_teams)
+        with self._lock:
+            self._snapshots[game_number] = snapshot
+
+    def update(self, game_number: int, stats: Stats, teams: List[TeamStats]) -> Delta:
+        current = _Snapshot(players=stats.players, teams=teams)
+        with self._lock:
+            previous = self._snapshots.get(game_number)
+            self._snapshots[game_number] = current
+        if previous is None:
+            current.player_leaders = _leaders(current.players, current.active_players)
+            current.team_leaders = _leaders(current.teams, current.active_teams)
+            return Delta()
+
+        player_changes = _diff_rows(previous.players, current.players)
+        team_changes = _diff_rows(previous.teams, current.teams)
+        same_players = (
+            current.players.keys() == previous.players.keys()
+            and current.active_players == previous.active_players
+        )
+        same_teams = (
+            current.teams.keys() == previous.teams.keys()
+            and current.active_teams == previous.active_teams
+        )
+        current.player_leaders = _leaders(
+            current.players,
+            current.active_players,
+            previous=previous.player_leaders if same_players else None,
+            changes=player_changes,
+        )
+        current.team_leaders = _leaders(
+            current.teams,
+            current.active_teams,
+            previous=previous.team_leaders if same_teams else None,
+            changes=team_changes,
+        )
+        return Delta(
+            players=player_changes,
+            teams=team_changes,
+            player_leaders=_diff_leaders(previous.player_leaders, current.player_leaders),
+            team_leaders=_diff_leaders(previous.team_leaders, current.team_leaders),
+        )
@@ -0,0 +1,158 @@
+__all__ = ["HistoryStore"]
+
+import json
+import logging
+import mmap
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from neptunes_hooks import get_data_root
+from neptunes_hooks.models import PlayerStats, Stats
+from neptunes_hooks.utils import STAT_NAMES
+
+LOGGER = logging.getLogger(__name__)
+COLUMNS = ["tick", "player", "active", *STAT_NAMES]
+ITEM_SIZE = array("q").itemsize
+
+
+class HistoryStore:
+    def __init__(self, game_number: int, folder: Optional[Path] = None):
+        self.game_number = game_number
+        self.folder = (folder or get_data_root() / "history") / str(game_number)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self.title, self._players = self._load_meta()
+        self._index = {x: i for i, x in enumerate(self._players)}
+        self._repair()
+
+    @property
+    def players(self) -> List[str]:
+        return list(self._players)
+
+    def _column_file(self, column: str) -> Path:
+        return self.folder / f"{column}.bin"
+
+    def _load_meta(self) -> Tuple[str, List[str]]:
+        meta_file = self.folder / "meta.json"
+        if not meta_file.exists():
+            return str(self.game_number), []
+        with meta_file.open("r", encoding="UTF-8") as stream:
+            content = json.load(stream)
+        return content["title"], content["players"]
+
+    def _save_meta(self) -> None:
+        meta_file = self.folder / "meta.json"
+        temp_file = meta_file.with_suffix(".tmp")
+        with temp_file.open("w", encoding="UTF-8") as stream:
+            json.dump({"title": self.title, "players": self._players}, stream)
+        temp_file.replace(meta_file)
+
+    def _repair(self) -> None:
+        sizes = [
+            self._column_file(x).stat().st_size if self._column_file(x).exists() else 0
+            for x in COLUMNS
+        ]
+        rows = min(sizes) // ITEM_SIZE
+        for column, size in zip(COLUMNS, sizes):
+            if size != rows * ITEM_SIZE:
+                LOGGER.warning(f"[{self.game_number}] Truncating partial history column {column}")
+                with self._column_file(column).open("ab") as stream:
+                    stream.truncate(rows * ITEM_SIZE)
+
+    def __len__(self) -> int:
+        tick_file = self._column_file("tick")
+        return tick_file.stat().st_size // ITEM_SIZE if tick_file.exists() else 0
+
+    def _read(self, column: str, start: int, end: int) -> array:
+        values = array("q")
+        if end <= start:
+            return values
+        with self._column_file(column).open("rb") as stream, mmap.mmap(
+            stream.fileno(),
+            0,
+            access=mmap.ACCESS_READ,
+        ) as mapped:
+            values.frombytes(mapped[start * ITEM_SIZE : end * ITEM_SIZE])
+        return values
+
+    def _tick_range(self, start_tick: Optional[int], end_tick: Optional[int]) -> range:
+        rows = len(self)
+        if not rows:
+            return range(0)
+        with self._column_file("tick").open("rb") as stream, mmap.mmap(
+            stream.fileno(),
+            0,
+            access=mmap.ACCESS_READ,
+        ) as mapped:
+            ticks = memoryview(mapped).cast("q")
+            try:
+                start = 0 if start_tick is None else bisect_left(ticks, start_tick)
+                end = rows if end_tick is None else bisect_right(ticks, end_tick)
+            finally:
+                ticks.release()
+        return range(start, end)
+
+    @property
+    def latest_tick(self) -> int:
+        rows = len(self)
+        return self._read("tick", rows - 1, rows)[0] if rows else -1
+
+    def append(self, stats: Stats) -> bool:
+        with self._lock:
+            if stats.tick <= self.latest_tick or not stats.players:
+                return False
+            new_players = [x.username for x in stats.players if x.username not in self._index]
+            for username in new_players:
+                self._index[username] = len(self._players)
+                self._players.append(username)
+            if new_players or stats.title != self.title:
+                self.title = stats.title
+                self._save_meta()
+
+            columns = {
+                "tick": array("q", [stats.tick] * len(stats.players)),
+                "player": array("q", [self._index[x.username] for x in stats.players]),
+                "active": array("q", [int(x.active) for x in stats.players]),
+            }
+            for stat in STAT_NAMES:
+                columns[stat] = array("q", [getattr(x, stat) for x in stats.players])
+            for column, values in columns.items():
+                with self._column_file(column).open("ab") as stream:
+                    values.tofile(stream)
+            return True
+
+    def query(
+        self,
+        start_tick: Optional[int] = None,
+        end_tick: Optional[int] = None,
+        usernames: Optional[Iterable[str]] = None,
+        stats: Optional[Iterable[str]] = None,
+    ) -> Dict[str, array]:
+        columns = ["tick", "player", "active", *(stats or STAT_NAMES)]
+        rows = self._tick_range(start_tick=start_tick, end_tick=end_tick)
+        result = {x: self._read(x, rows.start, rows.stop) for x in columns}
+        if usernames is not None:
+            wanted = {self._index[x] for x in usernames if x in self._index}
+            keep = [i for i, x in enumerate(result["player"]) if x in wanted]
+            result = {k: array("q", [v[i] for i in keep]) for k, v in result.items()}
+        return result
+
+    def ticks(self) -> List[int]:
+        return sorted(set(self._read("tick", 0, len(self))))
+
+    def load(self, tick: int) -> Optional[Stats]:
+        result = self.query(start_tick=tick, end_tick=tick)
+        if not result["tick"]:
+            return None
+        players = [
+            PlayerStats(
+                username=self._players[result["player"][i]],
+                active=bool(result["active"][i]),
+                **{x: result[x][i] for x in STAT_NAMES},
+            )
+            for i in range(len(result["tick"]))
+        ]
+        return Stats(title=self.title, tick=tick, active=True, players=players)
@@ -0,0 +1,51 @@
+__all__ = ["RunLock"]
+
+import os
+from pathlib import Path
+from typing import IO, Optional
+
+from neptunes_hooks import get_data_root
+
+try:
+    import fcntl
+except ModuleNotFoundError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class RunLock:
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or get_data_root() / "neptunes-hooks.lock"
+        self._stream: Optional[IO[str]] = None
+
+    def acquire(self, blocking: bool = False) -> bool:
+        if self._stream:
+            return True
+        stream = self.path.open("a+", encoding="UTF-8")
+        try:
+            if fcntl:
+                flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+                fcntl.flock(stream.fileno(), flags)
+            else:
+                stream.seek(0)
+                msvcrt.locking(stream.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        except OSError:
+            stream.close()
+            return False
+        stream.seek(0)
+        stream.truncate()
+        stream.write(str(os.getpid()))
+        stream.flush()
+        self._stream = stream
+        return True
+
+    def release(self) -> None:
+        if not self._stream:
+            return
+        if fcntl:
+            fcntl.flock(self._stream.fileno(), fcntl.LOCK_UN)
+        else:
+            self._stream.seek(0)
+            msvcrt.locking(self._stream.fileno(), msvcrt.LK_UNLCK, 1)
+        self._stream.close()
+        self._stream = None
@@ -0,0 +1,225 @@
+__all__ = [
+    "API_FETCH_SECONDS",
+    "LEADERBOARD_SECONDS",
+    "PARSE_SECONDS",
+    "RATE_LIMIT_SLEEP_SECONDS",
+    "REGISTRY",
+    "REQUEST_ERRORS",
+    "REQUEST_RETRIES",
+    "REQUEST_SECONDS",
+    "TICK_LAG_SECONDS",
+    "WEBHOOK_POST_SECONDS",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Registry",
+    "start_metrics_server",
+]
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], **extra: str) -> str:
+    pairs = [*zip(names, values), *extra.items()]
+    if not pairs:
+        return ""
+    content = ",".join(f'{key}="{_escape(str(value))}"' for key, value in pairs)
+    return f"{{{content}}}"
+
+
+class _Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, description: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self._lock = Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        return tuple(str(labels.get(x, "")) for x in self.labels)
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        ...
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, description: str, labels: Sequence[str] = ()):
+        super().__init__(name=name, description=description, labels=labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            return [
+                f"{self.name}{_format_labels(self.labels, key)} {value}"
+                for key, value in self._values.items()
+            ]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name=name, description=description, labels=labels)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            counts[bisect_left(self.buckets, value)] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: Any) -> int:
+        with self._lock:
+            return sum(self._counts.get(self._key(labels), []))
+
+    def _samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            for key, counts in self._counts.items():
+                total = 0
+                for bound, count in zip((*self.buckets, "+Inf"), counts):
+                    total += count
+                    labels = _format_labels(self.labels, key, le=str(bound))
+                    lines.append(f"{self.name}_bucket{labels} {total}")
+                lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {self._sums[key]}")
+                lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {total}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(x.render() for x in self._metrics.values()) + "\n"
+
+
+REGISTRY = Registry()
+API_FETCH_SECONDS = REGISTRY.register(
+    Histogram("neptunes_hooks_api_fetch_seconds", "Time to fetch a game from the API", ["game"]),
+)
+PARSE_SECONDS = REGISTRY.register(
+    Histogram("neptunes_hooks_parse_seconds", "Time to parse an API response", ["game"]),
+)
+LEADERBOARD_SECONDS = REGISTRY.register(
+    Histogram("neptunes_hooks_leaderboard_seconds", "Time to compute leaderboards", ["game"]),
+)
+WEBHOOK_POST_SECONDS = REGISTRY.register(
+    Histogram("neptunes_hooks_webhook_post_seconds", "Time to push a turn's cards", ["host"]),
+)
+REQUEST_SECONDS = REGISTRY.register(
+    Histogram("neptunes_hooks_request_seconds", "HTTP request latency", ["service"]),
+)
+REQUEST_RETRIES = REGISTRY.register(
+    Counter("neptunes_hooks_request_retries_total", "HTTP requests retried", ["service"]),
+)
+REQUEST_ERRORS = REGISTRY.register(
+    Counter("neptunes_hooks_request_errors_total", "HTTP requests that failed", ["service"]),
+)
+RATE_LIMIT_SLEEP_SECONDS = REGISTRY.register(
+    Counter(
+        "neptunes_hooks_rate_limit_sleep_seconds_total",
+        "Time spent waiting on rate limits",
+        ["service"],
+    ),
+)
+TICK_LAG_SECONDS = REGISTRY.register(
+    Gauge(
+        "neptunes_hooks_tick_lag_seconds",
+        "Time between a tick starting and its report being processed",
+        ["game"],
+    ),
+)
+
+
+def start_metrics_server(
+    port: int,
+    host: str = "127.0.0.1",
+    registry: Registry = REGISTRY,
+) -> "ThreadingHTTPServer":
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            content = registry.render().encode("UTF-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    LOGGER.info(f"Serving metrics on http://{host}:{server.server_address[1]}/metrics")
+    return server
@@ -1,9 +1,33 @@
-__all__ = ["Stats", "PlayerStats", "TeamStats"]
+__all__ = [
+    "Delta",
+    "Ranking",
+    "Report",
+    "Standings",
+    "Stats",
+    "PlayerStats",
+    "StatColumns",
+    "TeamStats",
+]
 
-from dataclasses import dataclass, field
-from typing import List
+from array import array
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Type, TypeVar
 
+T = TypeVar("T")
 
+
+def _slotted(cls: Type[T]) -> Type[T]:
+    names = tuple(x.name for x in fields(cls))
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in (*names, "__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
 class PlayerStats:
     username: str
@@ -24,14 +48,19 @@ class PlayerStats:
     manufacturing: int = 0
 
 
+@_slotted
 @dataclass
 class Stats:
     title: str
     tick: int = 0
+    tick_fragment: float = 0.0
+    minutes_per_tick: int = 60
+    paused: bool = False
     active: bool = False
     players: List[PlayerStats] = field(default_factory=list)
 
 
+@_slotted
 @dataclass
 class TeamStats:
     name: str
@@ -50,3 +79,76 @@ class TeamStats:
     weapons: int = 0
     banking: int = 0
     manufacturing: int = 0
+
+
+@dataclass
+class Delta:
+    players: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    teams: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    player_leaders: Dict[str, List[str]] = field(default_factory=dict)
+    team_leaders: Dict[str, List[str]] = field(default_factory=dict)
+
+
+@_slotted
+@dataclass
+class Ranking:
+    rank: int
+    name: str
+    value: int
+
+
+@dataclass
+class Standings:
+    stats: Dict[str, List[Ranking]] = field(default_factory=dict)
+    overall: List[Ranking] = field(default_factory=list)
+
+
+@dataclass
+class Report:
+    game_name: str
+    kind: str
+    turn: int
+    facts: List[Tuple[str, str]] = field(default_factory=list)
+    summary: str = ""
+    changes: List[Tuple[str, str]] = field(default_factory=list)
+    standings: List[Tuple[str, str]] = field(default_factory=list)
+    missed: List[int] = field(default_factory=list)
+
+    @property
+    def title(self) -> str:
+        return f"{self.game_name} - {self.kind.title()} Stats"
+
+    @property
+    def heading(self) -> str:
+        return f"Welcome to Turn {self.turn:02}"
+
+    @property
+    def subtitle(self) -> str:
+        return f"Here are the top {self.kind.title()}s for each stat."
+
+
+class StatColumns:
+    __slots__ = ("names", "active", "_columns")
+
+    def __init__(self, names: List[str], active: array, columns: Dict[str, array]):
+        self.names = names
+        self.active = active
+        self._columns = columns
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Any], stats: Sequence[str]) -> "StatColumns":
+        return cls(
+            names=[getattr(x, "username", None) or getattr(x, "name", "") for x in rows],
+            active=array("b", [x.active for x in rows]),
+            columns={stat: array("q", [getattr(x, stat) for x in rows]) for stat in stats},
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def column(self, stat: str) -> memoryview:
+        return memoryview(self._columns[stat])
+
+    def items(self) -> Iterator[Tuple[str, memoryview]]:
+        for stat in self._columns:
+            yield stat, self.column(stat)
@@ -0,0 +1,205 @@
+__all__ = ["Delivery", "Outbox"]
+
+import hashlib
+import json
+import logging
+import os
+import time
+from concurrent.futures import Executor, Future
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from itertools import groupby
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from neptunes_hooks import get_data_root
+from neptunes_hooks.services.exceptions import ServiceError
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class Delivery:
+    url: str
+    game_number: int
+    kind: str
+    turn: int
+    renderer: str
+    body: str
+    report: Dict[str, Any]
+    missed: List[int] = field(default_factory=list)
+    attempts: int = 0
+    next_attempt: float = 0.0
+
+    @property
+    def key(self) -> str:
+        digest = hashlib.sha256(self.url.encode("UTF-8")).hexdigest()[:16]
+        return f"{digest}-{self.game_number}-{self.kind}"
+
+
+class Outbox:
+    def __init__(
+        self,
+        folder: Optional[Path] = None,
+        min_backoff: float = 30,
+        max_backoff: float = 60 * 60,
+        games: Optional[Set[int]] = None,
+    ):
+        self.folder = folder or get_data_root() / "outbox"
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.games = games
+        self._lock = Lock()
+        self._wake = Event()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self._inflight: Dict[str, Future] = {}
+
+    def _entry_file(self, key: str) -> Path:
+        return self.folder / f"{key}.json"
+
+    def _read(self, entry_file: Path) -> Optional[Delivery]:
+        try:
+            with entry_file.open("r", encoding="UTF-8") as stream:
+                return Delivery(**json.load(stream))
+        except FileNotFoundError:
+            return None
+        except (TypeError, ValueError):
+            LOGGER.warning(f"Discarding unreadable delivery `{entry_file}`")
+            entry_file.unlink()
+            return None
+
+    def _write(self, delivery: Delivery) -> None:
+        entry_file = self._entry_file(delivery.key)
+        temp_file = entry_file.with_suffix(".tmp")
+        with temp_file.open("w", encoding="UTF-8") as stream:
+            json.dump(asdict(delivery), stream)
+            stream.flush()
+            os.fsync(stream.fileno())
+        temp_file.replace(entry_file)
+
+    def enqueue(self, delivery: Delivery) -> None:
+        with self._lock:
+            pending = self._read(self._entry_file(delivery.key))
+            if pending and pending.turn != delivery.turn:
+                delivery.missed = sorted({*pending.missed, pending.turn, *delivery.missed})
+                delivery.attempts = pending.attempts
+                delivery.next_attempt = pending.next_attempt
+                LOGGER.info(
+                    f"[{delivery.game_number}] Coalescing {delivery.kind} Turn {pending.turn:02} "
+                    f"into Turn {delivery.turn:02}",
+                )
+            self._write(delivery)
+        self._wake.set()
+
+    def pending(self) -> List[Delivery]:
+        with self._lock:
+            entries = (self._read(x) for x in sorted(self.folder.glob("*.json")))
+            return [x for x in entries if x and (self.games is None or x.game_number in self.games)]
+
+    def next_due(self) -> Optional[float]:
+        return min((x.next_attempt for x in self.pending()), default=None)
+
+    def _complete(self, delivery: Delivery) -> None:
+        with self._lock:
+            entry_file = self._entry_file(delivery.key)
+            current = self._read(entry_file)
+            if current is None:
+                return
+            if current.turn == delivery.turn:
+                entry_file.unlink()
+                return
+            current.missed = [
+                x for x in current.missed if x not in (delivery.turn, *delivery.missed)
+            ]
+            self._write(current)
+
+    def _defer(self, deliveries: List[Delivery]) -> None:
+        with self._lock:
+            for delivery in deliveries:
+                current = self._read(self._entry_file(delivery.key))
+                if current is None:
+                    continue
+                current.attempts += 1
+                delay = min(self.min_backoff * 2 ** (current.attempts - 1), self.max_backoff)
+                current.next_attempt = time.time() + delay
+                self._write(current)
+
+    def _send_batch(self, deliveries: List[Delivery], send: Callable[[Delivery], None]) -> int:
+        sent = 0
+        for index, delivery in enumerate(deliveries):
+            try:
+                send(delivery)
+            except ServiceError as err:
+                LOGGER.error(
+                    f"[{delivery.game_number}] Unable to deliver {delivery.kind} Turn "
+                    f"{delivery.turn:02}, will retry: {err}",
+                )
+                self._defer(deliveries[index:])
+                return sent
+            except Exception:  # noqa: BLE001
+                LOGGER.exception(
+                    f"[{delivery.game_number}] Failed to deliver {delivery.kind} Turn "
+                    f"{delivery.turn:02}, will retry",
+                )
+                self._defer([delivery])
+                continue
+            self._complete(delivery)
+            sent += 1
+        return sent
+
+    def _batches(self) -> List[List[Delivery]]:
+        now = time.time()
+        due = sorted(
+            (x for x in self.pending() if x.next_attempt <= now and x.url not in self._inflight),
+            key=lambda x: (x.url, x.game_number, x.turn, x.kind),
+        )
+        return [list(x) for _, x in groupby(due, key=lambda x: x.url)]
+
+    def drain(self, send: Callable[[Delivery], None], executor: Optional[Executor] = None) -> int:
+        batches = self._batches()
+        if executor is None:
+            return sum(self._send_batch(x, send) for x in batches)
+        return sum(executor.map(self._send_batch, batches, [send] * len(batches)))
+
+    def _finished(self, url: str, _future: Future) -> None:
+        self._inflight.pop(url, None)
+        self._wake.set()
+
+    def _dispatch(self, send: Callable[[Delivery], None], executor: Executor) -> None:
+        for batch in self._batches():
+            url = batch[0].url
+            self._inflight[url] = executor.submit(self._send_batch, batch, send)
+            self._inflight[url].add_done_callback(partial(self._finished, url))
+
+    def _next_wake(self) -> Optional[float]:
+        entries = (x for x in self.pending() if x.url not in self._inflight)
+        return min((x.next_attempt for x in entries), default=None)
+
+    def _run(self, send: Callable[[Delivery], None], executor: Optional[Executor]) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                if executor is None:
+                    self.drain(send=send)
+                else:
+                    self._dispatch(send=send, executor=executor)
+                next_due = self._next_wake()
+            except Exception:  # noqa: BLE001
+                LOGGER.exception("Outbox delivery failed, retrying")
+                next_due = time.time() + self.min_backoff
+            self._wake.wait(timeout=None if next_due is None else max(next_due - time.time(), 0))
+
+    def start(self, send: Callable[[Delivery], None], executor: Optional[Executor] = None) -> None:
+        self._stop.clear()
+        self._thread = Thread(target=self._run, args=(send, executor), name="outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,343 @@
+__all__ = ["RENDERERS", "Renderer", "build_reports", "register_renderer"]
+
+import json
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import replace
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type
+
+from neptunes_hooks.models import Delta, Report, Standings
+from neptunes_hooks.utils import STAT_NAMES
+
+LOGGER = logging.getLogger(__name__)
+TECH_NAMES = STAT_NAMES[7:]
+RENDERERS: Dict[str, "Renderer"] = {}
+
+
+def _format_changes(
+    changes: Dict[str, Dict[str, int]],
+    leaders: Dict[str, List[str]],
+) -> List[Tuple[str, str]]:
+    facts = []
+    for name, stats in sorted(changes.items()):
+        values = [
+            f"{stat} {value:+,}" if stat not in TECH_NAMES else f"{stat} +{value} Lvl"
+            for stat, value in stats.items()
+            if stat in ("stars", "ships") or (stat in TECH_NAMES and value > 0)
+        ]
+        if values:
+            facts.append((name, ", ".join(values)))
+    for stat, names in leaders.items():
+        facts.append((f"New {stat} leader", ", ".join(names)))
+    return facts
+
+
+def _ordinal(number: int) -> str:
+    suffix = (
+        "th" if 10 <= number % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+    )
+    return f"{number}{suffix}"
+
+
+def _format_standings(standings: Optional[Standings]) -> List[Tuple[str, str]]:
+    if not standings:
+        return []
+    return [(_ordinal(x.rank), f"{x.name} ({x.value:,} pts)") for x in standings.overall]
+
+
+def build_reports(
+    player_stats: Tuple[Dict[str, List[str]], List[str]],
+    team_stats: Optional[Tuple[Dict[str, List[str]], List[str]]],
+    turn: int,
+    game_name: str,
+    delta: Optional[Delta] = None,
+    player_standings: Optional[Standings] = None,
+    team_standings: Optional[Standings] = None,
+) -> Dict[str, Report]:
+    leaders, overall = player_stats
+    reports = {
+        "player": Report(
+            game_name=game_name,
+            kind="player",
+            turn=turn,
+            facts=[(key, ", ".join(sorted(value))) for key, value in leaders.items()],
+            summary="Looking at the above table it appears everyone should keep a close eye on "
+            f"**{' and '.join(overall)}** as they seem to be all over this leaderboard",
+            changes=_format_changes(delta.players, delta.player_leaders) if delta else [],
+            standings=_format_standings(player_standings),
+        ),
+    }
+    if team_stats:
+        leaders, overall = team_stats
+        reports["team"] = Report(
+            game_name=game_name,
+            kind="team",
+            turn=turn,
+            facts=[(key, ", ".join(sorted(value))) for key, value in leaders.items()],
+            summary=f"Everyone should keep a close eye on **{' and '.join(overall)}** as they're "
+            "all over this leaderboard",
+            changes=_format_changes(delta.teams, delta.team_leaders) if delta else [],
+            standings=_format_standings(team_standings),
+        )
+    return reports
+
+
+def _missed_text(report: Report) -> str:
+    return "Also covers the missed " + ", ".join(f"Turn {x:02}" for x in report.missed)
+
+
+def _standings_text(report: Report) -> str:
+    return "\n".join(f"{rank}: {value}" for rank, value in report.standings)
+
+
+def _trim(report: Report) -> Optional[Report]:
+    if report.changes:
+        return replace(report, changes=report.changes[:-1])
+    if report.standings:
+        return replace(report, standings=report.standings[:-1])
+    if len(report.facts) > 1:
+        return replace(report, facts=report.facts[:-1])
+    if report.summary:
+        return replace(report, summary="")
+    return None
+
+
+def _truncate(value: str, length: int) -> str:
+    return value if len(value) <= length else value[: length - 1] + "…"
+
+
+class Renderer(ABC):
+    name: ClassVar[str] = ""
+    max_bytes: ClassVar[Optional[int]] = None
+
+    @abstractmethod
+    def render(self, report: Report) -> Dict[str, Any]:
+        ...
+
+    def _dumps(self, report: Report) -> bytes:
+        return json.dumps(self.render(report), separators=(",", ":")).encode("UTF-8")
+
+    def encode(self, report: Report) -> bytes:
+        body = self._dumps(report)
+        if not self.max_bytes or len(body) <= self.max_bytes:
+            return body
+        trimmed = report
+        while len(body) > self.max_bytes and (trimmed := _trim(trimmed)):
+            body = self._dumps(trimmed)
+        LOGGER.warning(
+            f"Trimmed {report.title} Turn {report.turn:02} to {len(body):,} bytes for {self.name}",
+        )
+        return body
+
+
+def register_renderer(cls: Type[Renderer]) -> Type[Renderer]:
+    RENDERERS[cls.name] = cls()
+    return cls
+
+
+@register_renderer
+class MessageCardRenderer(Renderer):
+    name = "microsoft_teams"
+    max_bytes = 28 * 1024
+
+    def render(self, report: Report) -> Dict[str, Any]:
+        sections = [
+            {"activityTitle": report.heading, "activitySubtitle": report.subtitle},
+            {"facts": [{"name": name, "value": value} for name, value in report.facts]},
+        ]
+        if report.summary:
+            sections.append({"text": report.summary})
+        if report.standings:
+            sections.append(
+                {
+                    "activityTitle": "Overall standings",
+                    "facts": [{"name": name, "value": value} for name, value in report.standings],
+                },
+            )
+        if report.changes:
+            sections.append(
+                {
+                    "activityTitle": "Since last report",
+                    "facts": [{"name": name, "value": value} for name, value in report.changes],
+                },
+            )
+        if report.missed:
+            sections.append({"text": _missed_text(report)})
+        return {
+            "type": "message",
+            "attachments": [
+                {
+                    "contentType": "application/vnd.microsoft.teams.card.o365connector",
+                    "content": {
+                        "@type": "MessageCard",
+                        "@context": "http://schema.org/extensions",
+                        "title": report.title,
+                        "sections": sections,
+                    },
+                },
+            ],
+        }
+
+
+@register_renderer
+class AdaptiveCardRenderer(Renderer):
+    name = "teams_adaptive"
+    max_bytes = 28 * 1024
+
+    def render(self, report: Report) -> Dict[str, Any]:
+        body = [
+            {"type": "TextBlock", "text": report.title, "size": "Large", "weight": "Bolder"},
+            {"type": "TextBlock", "text": report.heading, "weight": "Bolder"},
+            {"type": "TextBlock", "text": report.subtitle, "isSubtle": True, "wrap": True},
+            {
+                "type": "FactSet",
+                "facts": [{"title": name, "value": value} for name, value in report.facts],
+            },
+        ]
+        if report.summary:
+            body.append({"type": "TextBlock", "text": report.summary, "wrap": True})
+        if report.standings:
+            body.append({"type": "TextBlock", "text": "Overall standings", "weight": "Bolder"})
+            body.append(
+                {
+                    "type": "FactSet",
+                    "facts": [{"title": name, "value": value} for name, value in report.standings],
+                },
+            )
+        if report.changes:
+            body.append({"type": "TextBlock", "text": "Since last report", "weight": "Bolder"})
+            body.append(
+                {
+                    "type": "FactSet",
+                    "facts": [{"title": name, "value": value} for name, value in report.changes],
+                },
+            )
+        if report.missed:
+            body.append(
+                {"type": "TextBlock", "text": _missed_text(report), "isSubtle": True, "wrap": True},
+            )
+        return {
+            "type": "message",
+            "attachments": [
+                {
+                    "contentType": "application/vnd.microsoft.card.adaptive",
+                    "content": {
+                        "type": "AdaptiveCard",
+                        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
+                        "version": "1.4",
+                        "body": body,
+                    },
+                },
+            ],
+        }
+
+
+@register_renderer
+class DiscordRenderer(Renderer):
+    name = "discord"
+    max_bytes = 6000
+    max_fields = 25
+
+    def render(self, report: Report) -> Dict[str, Any]:
+        description = [f"**{report.heading}**", report.subtitle]
+        if report.summary:
+            description.append(report.summary)
+        if report.missed:
+            description.append(_missed_text(report))
+        fields = [
+            {"name": _truncate(name, 256), "value": _truncate(value, 1024), "inline": True}
+            for name, value in report.facts
+        ]
+        if report.standings:
+            fields.append(
+                {
+                    "name": "Overall standings",
+                    "value": _truncate(_standings_text(report), 1024),
+                    "inline": False,
+                },
+            )
+        fields.extend(
+            {
+                "name": _truncate(f"Since last report: {name}", 256),
+                "value": _truncate(value, 1024),
+                "inline": False,
+            }
+            for name, value in report.changes
+        )
+        return {
+            "embeds": [
+                {
+                    "title": _truncate(report.title, 256),
+                    "description": _truncate("\n\n".join(description), 4096),
+                    "fields": fields[: self.max_fields],
+                },
+            ],
+        }
+
+
+@register_renderer
+class SlackRenderer(Renderer):
+    name = "slack"
+    max_bytes = 40000
+    max_blocks = 50
+
+    @staticmethod
+    def _fields(facts: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        fields = [
+            {"type": "mrkdwn", "text": _truncate(f"*{name}*\n{value}", 2000)}
+            for name, value in facts
+        ]
+        return [
+            {"type": "section", "fields": fields[x : x + 10]} for x in range(0, len(fields), 10)
+        ]
+
+    def render(self, report: Report) -> Dict[str, Any]:
+        blocks = [
+            {
+                "type": "header",
+                "text": {"type": "plain_text", "text": _truncate(report.title, 150)},
+            },
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": f"*{report.heading}*\n{report.subtitle}"},
+            },
+            *self._fields(report.facts),
+        ]
+        if report.summary:
+            text = report.summary.replace("**", "*")
+            blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": text}})
+        if report.standings:
+            text = _truncate(f"*Overall standings*\n{_standings_text(report)}", 3000)
+            blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": text}})
+        if report.changes:
+            blocks.append({"type": "divider"})
+            blocks.append(
+                {"type": "section", "text": {"type": "mrkdwn", "text": "*Since last report*"}},
+            )
+            blocks.extend(self._fields(report.changes))
+        if report.missed:
+            blocks.append(
+                {"type": "context", "elements": [{"type": "mrkdwn", "text": _missed_text(report)}]},
+            )
+        return {
+            "text": f"{report.title} - {report.heading}",
+            "blocks": blocks[: self.max_blocks],
+        }
+
+
+@register_renderer
+class JsonRenderer(Renderer):
+    name = "generic"
+
+    def render(self, report: Report) -> Dict[str, Any]:
+        return {
+            "game": report.game_name,
+            "kind": report.kind,
+            "turn": report.turn,
+            "title": report.title,
+            "leaders": [{"name": name, "value": value} for name, value in report.facts],
+            "summary": report.summary,
+            "standings": [{"rank": rank, "value": value} for rank, value in report.standings],
+            "changes": [{"name": name, "value": value} for name, value in report.changes],
+            "missed": report.missed,
+        }
@@ -0,0 +1,411 @@
+__all__ = [
+    "deliver",
+    "get_leaderboards",
+    "get_roster",
+    "get_webhooks",
+    "poll_game",
+    "run",
+    "run_shard",
+    "start",
+]
+
+import logging
+import signal
+import time
+from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from requests import Session
+
+from neptunes_hooks import setup_logging
+from neptunes_hooks.delta import DeltaEngine
+from neptunes_hooks.history import HistoryStore
+from neptunes_hooks.lock import RunLock
+from neptunes_hooks.metrics import (
+    LEADERBOARD_SECONDS,
+    TICK_LAG_SECONDS,
+    WEBHOOK_POST_SECONDS,
+    start_metrics_server,
+)
+from neptunes_hooks.models import Report, Standings, Stats, TeamStats
+from neptunes_hooks.outbox import Delivery, Outbox
+from neptunes_hooks.renderers import RENDERERS, build_reports
+from neptunes_hooks.scheduler import TickScheduler
+from neptunes_hooks.services._base import create_session
+from neptunes_hooks.services.cache import ResponseCache
+from neptunes_hooks.services.exceptions import ServiceError
+from neptunes_hooks.services.neptunes_pride import NeptunesPride
+from neptunes_hooks.services.webhook import Webhook
+from neptunes_hooks.settings import (
+    NeptunesPrideSettings,
+    PlayerSettings,
+    Settings,
+    SettingsWatcher,
+)
+from neptunes_hooks.state import StateStore
+from neptunes_hooks.utils import build_leaderboards, generate_teams
+
+if TYPE_CHECKING:
+    from neptunes_hooks.server import StatsCache
+
+LOGGER = logging.getLogger(__name__)
+SETTINGS_CHECK_INTERVAL = 5
+
+
+def get_roster(state: StateStore) -> List[PlayerSettings]:
+    players = Settings().players
+    configured = {x.username for x in players}
+    return players + [PlayerSettings(username=x) for x in state.players if x not in configured]
+
+
+def get_webhooks(destinations: Dict[str, List[str]], session: Session) -> Dict[str, Webhook]:
+    return {x: Webhook(url=x, session=session) for urls in destinations.values() for x in urls}
+
+
+def get_leaderboards(
+    stats: Stats,
+    roster: List[PlayerSettings],
+    teams: Optional[List[TeamStats]] = None,
+) -> Tuple[
+    Tuple[Dict[str, List[str]], List[str]],
+    Optional[Tuple[Dict[str, List[str]], List[str]]],
+    Standings,
+    Optional[Standings],
+]:
+    settings = Settings().leaderboard
+    return build_leaderboards(
+        stats,
+        roster,
+        teams=teams,
+        top=settings.top,
+        weights=settings.weights,
+    )
+
+
+def deliver(delivery: Delivery, webhooks: Dict[str, Webhook]) -> None:
+    host = urlparse(delivery.url).netloc
+    webhook = webhooks.get(delivery.url)
+    if webhook is None:
+        LOGGER.warning(
+            f"[{delivery.game_number}] Dropping {delivery.kind} stats for {host}, "
+            "it's no longer configured",
+        )
+        return
+    body = delivery.body.encode("UTF-8")
+    if delivery.missed:
+        report = Report(**{**delivery.report, "missed": delivery.missed})
+        body = RENDERERS[delivery.renderer].encode(report)
+    with WEBHOOK_POST_SECONDS.time(host=host):
+        webhook.post(body=body)
+    LOGGER.info(f"[{delivery.game_number}] Pushed {delivery.kind} stats to {host}")
+
+
+def poll_game(
+    game: NeptunesPrideSettings,
+    neptunes_pride: NeptunesPride,
+    history: HistoryStore,
+    deltas: DeltaEngine,
+    state: StateStore,
+    destinations: Dict[str, List[str]],
+    outbox: Outbox,
+    force: bool = False,
+    stats_cache: Optional["StatsCache"] = None,
+) -> Tuple[bool, Optional[Stats]]:
+    try:
+        response = neptunes_pride.pull_data()
+    except ServiceError as err:
+        LOGGER.error(f"[{game.game_number}] Unable to pull data: {err}")
+        return True, None
+    except (KeyError, TypeError, ValueError) as err:
+        LOGGER.error(f"[{game.game_number}] Unable to parse data: {err!r}")
+        return True, None
+    if not response:
+        return False, None
+    if new_players := state.add_players(x.username for x in response.players):
+        LOGGER.info(f"[{game.game_number}] Found new players: {', '.join(new_players)}")
+    history.append(response)
+
+    new_turn = response.tick > state.last_tick(game.game_number, default=game.last_tick) or force
+    if stats_cache and not new_turn and stats_cache.tick(game.game_number) != response.tick:
+        leaderboards = get_leaderboards(response, get_roster(state))
+        stats_cache.update(game.game_number, response, *leaderboards)
+    if new_turn:
+        turn = int(response.tick / game.tick_rate)
+        LOGGER.info(f"[{game.game_number}] {response.title} - Turn {turn:02}")
+
+        TICK_LAG_SECONDS.set(
+            response.tick_fragment * response.minutes_per_tick * 60,
+            game=game.game_number,
+        )
+        roster = get_roster(state)
+        with LEADERBOARD_SECONDS.time(game=game.game_number):
+            teams = generate_teams(response, roster)
+            leaderboards = get_leaderboards(response, roster, teams=teams)
+            delta = deltas.update(game.game_number, response, teams)
+        if stats_cache:
+            stats_cache.update(game.game_number, response, *leaderboards)
+        player_stats, team_stats, player_standings, team_standings = leaderboards
+
+        reports = build_reports(
+            player_stats=player_stats,
+            team_stats=team_stats,
+            turn=turn,
+            game_name=response.title,
+            delta=delta,
+            player_standings=player_standings,
+            team_standings=team_standings,
+        )
+        for renderer, urls in destinations.items():
+            for kind, report in reports.items():
+                body = RENDERERS[renderer].encode(report).decode("UTF-8")
+                for url in urls:
+                    outbox.enqueue(
+                        Delivery(
+                            url=url,
+                            game_number=game.game_number,
+                            kind=kind,
+                            turn=turn,
+                            renderer=renderer,
+                            body=body,
+                            report=asdict(report),
+                        ),
+                    )
+        state.set_last_tick(game.game_number, response.tick)
+        LOGGER.debug(f"[{game.game_number}] Waiting for next turn...")
+    return response.active, response
+
+
+def connect_games(
+    games: List[NeptunesPrideSettings],
+    clients: Dict[int, NeptunesPride],
+    histories: Dict[int, HistoryStore],
+    deltas: DeltaEngine,
+    state: StateStore,
+    session: Session,
+    cache: ResponseCache,
+    offline: bool = False,
+) -> None:
+    for game in games:
+        client = clients.get(game.game_number)
+        if client and client.code == game.api_code:
+            continue
+        clients[game.game_number] = NeptunesPride(
+            game_number=game.game_number,
+            code=game.api_code,
+            session=session,
+            cache=cache,
+            offline=offline,
+        )
+        if game.game_number not in histories:
+            histories[game.game_number] = HistoryStore(game_number=game.game_number)
+            stats = histories[game.game_number].load(
+                state.last_tick(game.game_number, default=game.last_tick),
+            )
+            deltas.seed(
+                game_number=game.game_number,
+                stats=stats,
+                teams=generate_teams(stats, get_roster(state)) if stats else [],
+            )
+
+
+def run(
+    args: Namespace,
+    games: List[NeptunesPrideSettings],
+    watcher: Optional[SettingsWatcher],
+    session: Session,
+    destinations: Dict[str, List[str]],
+    owned: Optional[Set[int]] = None,
+    stats_cache: Optional["StatsCache"] = None,
+) -> None:
+    webhooks = get_webhooks(destinations=destinations, session=session)
+    cache_settings = Settings().cache
+    cache = ResponseCache(
+        max_entries=cache_settings.max_entries,
+        max_age=timedelta(days=cache_settings.max_age_days).total_seconds(),
+    )
+    cache.evict()
+    outbox = Outbox(games=owned)
+    send = partial(deliver, webhooks=webhooks)
+    state = StateStore()
+    deltas = DeltaEngine()
+    clients: Dict[int, NeptunesPride] = {}
+    histories: Dict[int, HistoryStore] = {}
+    connect = partial(
+        connect_games,
+        clients=clients,
+        histories=histories,
+        deltas=deltas,
+        state=state,
+        session=session,
+        cache=cache,
+        offline=args.offline,
+    )
+    connect(games)
+
+    scheduler = TickScheduler(poll=args.poll)
+    if args.once:
+        offset = time.monotonic() - time.time()
+        next_polls = {x.game_number: state.next_poll(x.game_number) + offset for x in games}
+    else:
+        next_polls = {x.game_number: 0.0 for x in games}
+    finished = set()
+    workers = max(1, min(args.workers, len(games)))
+    with ThreadPoolExecutor(max_workers=workers) as executor, ThreadPoolExecutor(
+        max_workers=max(len(webhooks), 1),
+    ) as webhook_executor:
+        if not (args.debug or args.once):
+            outbox.start(send=send, executor=webhook_executor)
+        try:
+            while games:
+                if watcher and watcher.check():
+                    settings = watcher.settings
+                    games = [
+                        x
+                        for x in settings.all_games
+                        if x.game_number not in finished
+                        and (owned is None or x.game_number in owned)
+                    ]
+                    connect(games)
+                    for game in games:
+                        next_polls.setdefault(game.game_number, 0.0)
+                    if settings.webhooks.destinations:
+                        destinations = settings.webhooks.destinations
+                        configured = get_webhooks(destinations=destinations, session=session)
+                        for url in set(webhooks) - set(configured):
+                            del webhooks[url]
+                        for url, webhook in configured.items():
+                            webhooks.setdefault(url, webhook)
+
+                now = time.monotonic()
+                ready = [x for x in games if next_polls[x.game_number] <= now]
+                poll = partial(
+                    poll_game,
+                    deltas=deltas,
+                    state=state,
+                    destinations=destinations,
+                    outbox=outbox,
+                    force=args.debug,
+                    stats_cache=stats_cache,
+                )
+                results = executor.map(
+                    poll,
+                    ready,
+                    [clients[x.game_number] for x in ready],
+                    [histories[x.game_number] for x in ready],
+                )
+                for game, (active, response) in zip(ready, results):
+                    delay = scheduler.next_poll(game=game, stats=response)
+                    next_polls[game.game_number] = time.monotonic() + delay
+                    state.set_next_poll(game.game_number, time.time() + delay)
+                    if not active:
+                        finished.add(game.game_number)
+                        games.remove(game)
+                state.flush()
+                if args.debug or args.once or not games:
+                    break
+                delay = min(next_polls[x.game_number] for x in games) - time.monotonic()
+                if delay > 0:
+                    LOGGER.debug(f"Sleeping for {delay:,.0f}s")
+                    time.sleep(min(delay, SETTINGS_CHECK_INTERVAL))
+        finally:
+            outbox.stop()
+            state.flush()
+        if args.debug or args.once:
+            outbox.drain(send=send, executor=webhook_executor)
+
+    if args.once and games:
+        wake_up = min(state.next_poll(x.game_number) for x in games)
+        next_delivery = outbox.next_due()
+        if next_delivery is not None:
+            wake_up = min(wake_up, next_delivery)
+        timestamp = datetime.fromtimestamp(wake_up).isoformat(timespec="seconds")
+        LOGGER.info(f"Next run suggested at {timestamp} (in {max(wake_up - time.time(), 0):,.0f}s)")
+
+
+def _handle_sigterm(signum: int, _frame: Any) -> None:
+    raise SystemExit(128 + signum)
+
+
+def run_shard(args: Namespace, game_numbers: List[int]) -> None:
+    setup_logging(debug=args.debug, queue=args.log_queue)
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+    settings = Settings()
+    owned = set(game_numbers)
+    session = create_session(
+        pool_size=settings.http.pool_size,
+        retries=settings.http.retries,
+        backoff_factor=settings.http.backoff_factor,
+    )
+    run(
+        args=args,
+        games=[x for x in settings.all_games if x.game_number in owned],
+        watcher=SettingsWatcher(),
+        session=session,
+        destinations=settings.webhooks.destinations,
+        owned=owned,
+    )
+
+
+def start(args: Namespace) -> None:
+    LOGGER.info("Welcome to Neptune's Pride")
+    if args.metrics_port is not None:
+        if args.supervise:
+            LOGGER.warning("The metrics server isn't available with `--supervise`, skipping.")
+        else:
+            start_metrics_server(port=args.metrics_port)
+    stats_cache = None
+    if args.stats_port is not None:
+        if args.supervise:
+            LOGGER.warning("The stats server isn't available with `--supervise`, skipping.")
+        else:
+            from neptunes_hooks.server import StatsCache, start_stats_server
+
+            stats_cache = StatsCache()
+            start_stats_server(port=args.stats_port, cache=stats_cache)
+    settings = Settings()
+    watcher = SettingsWatcher()
+    games = settings.all_games
+    if not games:
+        LOGGER.fatal("No games were specified, closing down.")
+        return
+    session = create_session(
+        pool_size=settings.http.pool_size,
+        retries=settings.http.retries,
+        backoff_factor=settings.http.backoff_factor,
+    )
+    destinations = settings.webhooks.destinations
+    if not destinations:
+        LOGGER.fatal("No webhooks were specified, closing down.")
+        return
+
+    lock = RunLock()
+    if not lock.acquire():
+        LOGGER.fatal(f"Another run is holding `{lock.path}`, closing down.")
+        return
+    try:
+        if args.supervise:
+            from neptunes_hooks.supervisor import Supervisor
+
+            supervisor = Supervisor(
+                target=partial(run_shard, args),
+                processes=args.processes,
+                watcher=watcher,
+            )
+            supervisor.run(games=[x.game_number for x in games])
+            return
+        signal.signal(signal.SIGTERM, _handle_sigterm)
+        run(
+            args=args,
+            games=games,
+            watcher=watcher,
+            session=session,
+            destinations=destinations,
+            stats_cache=stats_cache,
+        )
+    finally:
+        lock.release()
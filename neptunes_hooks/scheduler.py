@@ -0,0 +1,41 @@
+__all__ = ["TickScheduler"]
+
+import logging
+from typing import Dict, Optional
+
+from neptunes_hooks.models import Stats
+from neptunes_hooks.settings import NeptunesPrideSettings
+
+LOGGER = logging.getLogger(__name__)
+MINUTE = 60
+
+
+class TickScheduler:
+    def __init__(self, poll: int = 30, margin: int = 60, min_backoff: int = 60):
+        self.poll = poll * MINUTE
+        self.margin = margin
+        self.min_backoff = min_backoff
+        self._expected: Dict[int, int] = {}
+        self._misses: Dict[int, int] = {}
+
+    def next_poll(self, game: NeptunesPrideSettings, stats: Optional[Stats]) -> float:
+        if not stats or stats.paused or stats.minutes_per_tick <= 0:
+            return self.poll
+
+        tick_seconds = stats.minutes_per_tick * MINUTE
+        expected = self._expected.get(game.game_number)
+        if expected is not None and stats.tick < expected:
+            remaining = (expected - stats.tick - stats.tick_fragment) * tick_seconds
+            if remaining > 0:
+                return remaining + self.margin
+            misses = self._misses.get(game.game_number, 0) + 1
+            self._misses[game.game_number] = misses
+            delay = min(self.min_backoff * 2 ** (misses - 1), self.poll)
+            LOGGER.debug(f"[{game.game_number}] Missed tick {expected}, retrying in {delay}s")
+            return delay
+
+        self._misses[game.game_number] = 0
+        ticks_to_turn = game.tick_rate - stats.tick % game.tick_rate if game.tick_rate > 0 else 1
+        self._expected[game.game_number] = stats.tick + ticks_to_turn
+        remaining = (ticks_to_turn - stats.tick_fragment) * tick_seconds
+        return max(remaining, 0) + self.margin
@@ -0,0 +1,156 @@
+__all__ = ["StatsCache", "start_stats_server"]
+
+import gzip
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from neptunes_hooks.models import Standings, Stats
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    body: bytes
+    compressed: bytes
+    etag: str
+
+
+def _leaderboard(
+    game_number: int,
+    stats: Stats,
+    leaderboard: Tuple[Dict[str, List[str]], List[str]],
+    standings: Standings,
+) -> Dict[str, Any]:
+    leaders, overall = leaderboard
+    return {
+        "game_number": game_number,
+        "tick": stats.tick,
+        "leaders": [{"stat": key, "names": sorted(value)} for key, value in leaders.items()],
+        "overall": overall,
+        "standings": asdict(standings),
+    }
+
+
+class StatsCache:
+    def __init__(self, compress_level: int = 6):
+        self.compress_level = compress_level
+        self._lock = Lock()
+        self._entries: Dict[str, _Entry] = {}
+        self._games: Dict[int, Dict[str, Any]] = {}
+
+    def _encode(self, content: Any) -> _Entry:
+        body = json.dumps(content, separators=(",", ":")).encode("UTF-8")
+        return _Entry(
+            body=body,
+            compressed=gzip.compress(body, compresslevel=self.compress_level, mtime=0),
+            etag=hashlib.sha256(body).hexdigest()[:32],
+        )
+
+    def tick(self, game_number: int) -> Optional[int]:
+        with self._lock:
+            game = self._games.get(game_number)
+            return game["tick"] if game else None
+
+    def get(self, path: str) -> Optional[_Entry]:
+        with self._lock:
+            return self._entries.get(path.rstrip("/") or "/")
+
+    def update(
+        self,
+        game_number: int,
+        stats: Stats,
+        player_stats: Tuple[Dict[str, List[str]], List[str]],
+        team_stats: Optional[Tuple[Dict[str, List[str]], List[str]]],
+        player_standings: Standings,
+        team_standings: Optional[Standings],
+    ) -> None:
+        prefix = f"/games/{game_number}"
+        entries = {
+            prefix: self._encode({"game_number": game_number, **asdict(stats)}),
+            f"{prefix}/players": self._encode(
+                _leaderboard(game_number, stats, player_stats, player_standings),
+            ),
+        }
+        if team_stats and team_standings:
+            entries[f"{prefix}/teams"] = self._encode(
+                _leaderboard(game_number, stats, team_stats, team_standings),
+            )
+        with self._lock:
+            self._entries = {
+                **{x: y for x, y in self._entries.items() if not x.startswith(f"{prefix}/")},
+                **entries,
+            }
+            self._games[game_number] = {
+                "game_number": game_number,
+                "title": stats.title,
+                "tick": stats.tick,
+                "active": stats.active,
+                "teams": f"{prefix}/teams" in entries,
+            }
+            self._entries["/games"] = self._encode(
+                [self._games[x] for x in sorted(self._games)],
+            )
+
+
+def _etags(header: Optional[str]) -> List[str]:
+    if not header:
+        return []
+    tags = (x.strip() for x in header.split(","))
+    return [(x[2:] if x.startswith("W/") else x).strip('"') for x in tags]
+
+
+def start_stats_server(
+    port: int,
+    cache: StatsCache,
+    host: str = "127.0.0.1",
+) -> "ThreadingHTTPServer":
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class StatsHandler(BaseHTTPRequestHandler):
+        def _respond(self, head: bool = False) -> None:
+            entry = cache.get(self.path.split("?")[0])
+            if entry is None:
+                self.send_error(404)
+                return
+            compress = "gzip" in self.headers.get("Accept-Encoding", "")
+            etag = f"{entry.etag}-gzip" if compress else entry.etag
+            matches = _etags(self.headers.get("If-None-Match"))
+            if "*" in matches or entry.etag in matches or f"{entry.etag}-gzip" in matches:
+                self.send_response(304)
+                self.send_header("ETag", f'"{etag}"')
+                self.end_headers()
+                return
+            content = entry.compressed if compress else entry.body
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.send_header("ETag", f'"{etag}"')
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+            if compress:
+                self.send_header("Content-Encoding", "gzip")
+            self.end_headers()
+            if not head:
+                self.wfile.write(content)
+
+        def do_GET(self) -> None:  # noqa: N802
+            self._respond()
+
+        def do_HEAD(self) -> None:  # noqa: N802
+            self._respond(head=True)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), StatsHandler)
+    Thread(target=server.serve_forever, name="stats", daemon=True).start()
+    LOGGER.info(f"Serving stats on http://{host}:{server.server_address[1]}/games")
+    return server
@@ -1,20 +1,72 @@
-__all__ = ["Service"]
+__all__ = ["NEPTUNES_PRIDE_ROOT", "Service", "create_session"]
 
 import logging
-from typing import Any, Dict
+from threading import Lock
+from typing import IO, Any, Callable, ClassVar, Dict, Optional, Union
 
-from ratelimit import limits, sleep_and_retry
-from requests import post
-from requests.exceptions import ConnectionError, HTTPError, JSONDecodeError, ReadTimeout
+import urllib3
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, HTTPError, ReadTimeout, RequestException
+from urllib3.util.retry import Retry
 
+from neptunes_hooks.metrics import (
+    RATE_LIMIT_SLEEP_SECONDS,
+    REQUEST_ERRORS,
+    REQUEST_RETRIES,
+    REQUEST_SECONDS,
+)
+from neptunes_hooks.services._ratelimit import RateLimiter
 from neptunes_hooks.services.exceptions import ServiceError
 
 LOGGER = logging.getLogger(__name__)
 MINUTE = 60
+NEPTUNES_PRIDE_ROOT = "https://np.ironhelmet.com/"
+
+
+def create_session(pool_size: int = 10, retries: int = 3, backoff_factor: float = 0.5) -> Session:
+    api_adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,
+        ),
+    )
+    webhook_adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=retries,
+            read=0,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 503),
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session = Session()
+    session.mount("http://", webhook_adapter)
+    session.mount("https://", webhook_adapter)
+    session.mount(NEPTUNES_PRIDE_ROOT, api_adapter)
+    return session
 
 
 class Service:
-    def __init__(self, url: str, timeout: int = 30):
+    _session: ClassVar[Optional[Session]] = None
+    _session_lock: ClassVar[Lock] = Lock()
+
+    def __init__(
+        self,
+        url: str,
+        timeout: int = 30,
+        session: Optional[Session] = None,
+        limiter: Optional[RateLimiter] = None,
+    ):
         self.url = url
         self.headers = {
             "Accept": "application/json",
@@ -22,73 +74,62 @@ def __init__(self, url: str, timeout: int = 30):
             "User-Agent": "Neptune's Hooks",
         }
         self.timeout = timeout
+        self.session = session or self.shared_session()
+        self.limiter = limiter or RateLimiter(calls=20, period=MINUTE)
 
-    @sleep_and_retry
-    @limits(calls=20, period=MINUTE)
-    def _perform_post_json_request(
-        self,
-        params: Dict[str, str] = None,
-        body: Dict[str, Any] = None,
-    ) -> Dict[str, Any]:
-        if params is None:
-            params = {}
-        if body is None:
-            body = {}
+    @classmethod
+    def shared_session(cls) -> Session:
+        with Service._session_lock:
+            if Service._session is None:
+                Service._session = create_session()
+            return Service._session
 
-        try:
-            response = post(
-                self.url,
-                params=params,
-                headers=self.headers,
-                timeout=self.timeout,
-                json=body,
-            )
-            response.raise_for_status()
-            return response.json()
-        except ConnectionError as err:
-            LOGGER.critical(err)
-            raise ServiceError(f"Unable to connect to `{self.url}`") from err
-        except HTTPError as err:
-            LOGGER.error(err)
-            raise ServiceError(err.response.text) from err
-        except JSONDecodeError as err:
-            LOGGER.critical(err)
-            raise ServiceError(f"Unable to parse response from `{self.url}` as Json") from err
-        except ReadTimeout as err:
-            LOGGER.warning(err)
-            raise ServiceError("Service took too long to respond") from err
-
-    @sleep_and_retry
-    @limits(calls=20, period=MINUTE)
-    def _perform_post_data_request(
+    def _perform_post_request(
         self,
-        params: Dict[str, str] = None,
-        body: Dict[str, Any] = None,
+        params: Optional[Dict[str, str]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
+        parser: Optional[Callable[[IO[bytes]], Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
-        if params is None:
-            params = {}
-        if body is None:
-            body = {}
-
+        service = type(self).__name__
+        RATE_LIMIT_SLEEP_SECONDS.inc(self.limiter.acquire(), service=service)
         try:
-            response = post(
-                self.url,
-                params=params,
-                headers=self.headers,
-                timeout=self.timeout,
-                data=body,
-            )
-            response.raise_for_status()
-            return response.json()
+            with REQUEST_SECONDS.time(service=service):
+                response = self.session.post(
+                    self.url,
+                    params=params or {},
+                    headers=self.headers,
+                    timeout=self.timeout,
+                    json=json,
+                    data=data,
+                    stream=parser is not None,
+                )
+                retries = getattr(response.raw, "retries", None)
+                if retries and retries.history:
+                    REQUEST_RETRIES.inc(len(retries.history), service=service)
+                with response:
+                    response.raise_for_status()
+                    if parser is None:
+                        return response.json()
+                    response.raw.decode_content = True
+                    return parser(response.raw)
         except ConnectionError as err:
+            REQUEST_ERRORS.inc(service=service)
             LOGGER.critical(err)
             raise ServiceError(f"Unable to connect to `{self.url}`") from err
         except HTTPError as err:
+            REQUEST_ERRORS.inc(service=service)
             LOGGER.error(err)
             raise ServiceError(err.response.text) from err
-        except JSONDecodeError as err:
+        except ValueError as err:
+            REQUEST_ERRORS.inc(service=service)
             LOGGER.critical(err)
             raise ServiceError(f"Unable to parse response from `{self.url}` as Json") from err
         except ReadTimeout as err:
+            REQUEST_ERRORS.inc(service=service)
             LOGGER.warning(err)
             raise ServiceError("Service took too long to respond") from err
+        except (urllib3.exceptions.HTTPError, RequestException) as err:
+            REQUEST_ERRORS.inc(service=service)
+            LOGGER.error(err)
+            raise ServiceError(f"Unable to read response from `{self.url}`") from err
@@ -0,0 +1,38 @@
+__all__ = ["RateLimiter"]
+
+import time
+from threading import Lock
+
+
+class RateLimiter:
+    def __init__(self, calls: int, period: float):
+        self.calls = calls
+        self.period = period
+        self._tokens = float(calls)
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            rate = self.calls / self.period
+            self._tokens = min(self.calls, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / rate
+
+    def acquire(self) -> float:
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        import asyncio
+
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
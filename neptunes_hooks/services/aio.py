@@ -0,0 +1,168 @@
+__all__ = ["AsyncMicrosoftTeams", "AsyncNeptunesPride", "AsyncService", "create_async_client"]
+
+import logging
+from types import TracebackType
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type
+
+import httpx
+
+from neptunes_hooks.metrics import RATE_LIMIT_SLEEP_SECONDS, REQUEST_ERRORS, REQUEST_SECONDS
+from neptunes_hooks.models import Delta, Stats
+from neptunes_hooks.renderers import RENDERERS, build_reports
+from neptunes_hooks.services._base import NEPTUNES_PRIDE_ROOT
+from neptunes_hooks.services._ratelimit import RateLimiter
+from neptunes_hooks.services.exceptions import ServiceError
+from neptunes_hooks.services.neptunes_pride import parse_stats
+
+LOGGER = logging.getLogger(__name__)
+MINUTE = 60
+
+
+def create_async_client(pool_size: int = 10, retries: int = 3) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        transport=httpx.AsyncHTTPTransport(retries=retries),
+    )
+
+
+class _SharedClient:
+    _client: ClassVar[Optional[httpx.AsyncClient]] = None
+
+    @classmethod
+    def get(cls) -> httpx.AsyncClient:
+        if cls._client is None or cls._client.is_closed:
+            cls._client = create_async_client()
+        return cls._client
+
+    @classmethod
+    def release(cls, client: httpx.AsyncClient) -> None:
+        if client is cls._client:
+            cls._client = None
+
+
+class AsyncService:
+    def __init__(
+        self,
+        url: str,
+        timeout: int = 30,
+        client: Optional[httpx.AsyncClient] = None,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        self.url = url
+        self.headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "User-Agent": "Neptune's Hooks",
+        }
+        self.timeout = timeout
+        self.client = client or self.shared_client()
+        self.limiter = limiter or RateLimiter(calls=20, period=MINUTE)
+
+    @classmethod
+    def shared_client(cls) -> httpx.AsyncClient:
+        return _SharedClient.get()
+
+    async def aclose(self) -> None:
+        _SharedClient.release(self.client)
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncService":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def _perform_post_request(
+        self,
+        params: Optional[Dict[str, str]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+    ) -> Dict[str, Any]:
+        service = type(self).__name__
+        RATE_LIMIT_SLEEP_SECONDS.inc(await self.limiter.acquire_async(), service=service)
+        try:
+            with REQUEST_SECONDS.time(service=service):
+                response = await self.client.post(
+                    self.url,
+                    params=params or {},
+                    headers=self.headers,
+                    timeout=self.timeout,
+                    json=json,
+                    data=data,
+                    content=content,
+                )
+                response.raise_for_status()
+                return response.json()
+        except httpx.TimeoutException as err:
+            REQUEST_ERRORS.inc(service=service)
+            LOGGER.warning(err)
+            raise ServiceError("Service took too long to respond") from err
+        except httpx.TransportError as err:
+            REQUEST_ERRORS.inc(service=service)
+            LOGGER.critical(err)
+            raise ServiceError(f"Unable to connect to `{self.url}`") from err
+        except httpx.HTTPStatusError as err:
+            REQUEST_ERRORS.inc(service=service)
+            LOGGER.error(err)
+            raise ServiceError(err.response.text) from err
+        except ValueError as err:
+            REQUEST_ERRORS.inc(service=service)
+            LOGGER.critical(err)
+            raise ServiceError(f"Unable to parse response from `{self.url}` as Json") from err
+
+
+class AsyncNeptunesPride(AsyncService):
+    def __init__(
+        self,
+        game_number: int,
+        code: str,
+        timeout: int = 30,
+        client: Optional[httpx.AsyncClient] = None,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        super().__init__(
+            url=f"{NEPTUNES_PRIDE_ROOT}api",
+            timeout=timeout,
+            client=client,
+            limiter=limiter,
+        )
+        self.game_number = game_number
+        self.code = code
+
+    async def pull_data(self) -> Stats:
+        data = await self._get_stats()
+        if not data:
+            return {}
+        return parse_stats(data)
+
+    async def _get_stats(self) -> Dict[str, Any]:
+        return await self._perform_post_request(
+            data={"api_version": "0.1", "game_number": self.game_number, "code": self.code},
+        )
+
+
+class AsyncMicrosoftTeams(AsyncService):
+    async def push_data(
+        self,
+        player_stats: Tuple[Dict[str, List[str]], List[str]],
+        team_stats: Optional[Tuple[Dict[str, List[str]], List[str]]],
+        turn: int,
+        game_name: str,
+        delta: Optional[Delta] = None,
+    ) -> None:
+        reports = build_reports(
+            player_stats=player_stats,
+            team_stats=team_stats,
+            turn=turn,
+            game_name=game_name,
+            delta=delta,
+        )
+        for kind, report in reports.items():
+            await self._perform_post_request(content=RENDERERS["microsoft_teams"].encode(report))
+            LOGGER.info(f"Pushed {kind} stats to Microsoft Teams")
@@ -0,0 +1,80 @@
+__all__ = ["ResponseCache"]
+
+import json
+import logging
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from neptunes_hooks import get_cache_root
+
+LOGGER = logging.getLogger(__name__)
+DAY = 24 * 60 * 60
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        folder: Optional[Path] = None,
+        max_entries: int = 1000,
+        max_age: float = 30 * DAY,
+    ):
+        self.folder = folder or get_cache_root() / "responses"
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._lock = Lock()
+
+    def _file(self, game_number: int, tick: int) -> Path:
+        return self.folder / str(game_number) / f"{tick:06}.json"
+
+    def ticks(self, game_number: int) -> List[int]:
+        folder = self.folder / str(game_number)
+        if not folder.exists():
+            return []
+        return sorted(int(x.stem) for x in folder.glob("*.json"))
+
+    def get(self, game_number: int, tick: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        if tick is None:
+            ticks = self.ticks(game_number)
+            if not ticks:
+                return None
+            tick = ticks[-1]
+        try:
+            with self._file(game_number, tick).open("rb") as stream:
+                return json.load(stream)
+        except FileNotFoundError:
+            return None
+
+    def put(self, game_number: int, tick: int, content: Dict[str, Any]) -> None:
+        cache_file = self._file(game_number, tick)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_suffix(".tmp")
+        with temp_file.open("w", encoding="UTF-8") as stream:
+            json.dump(content, stream, separators=(",", ":"))
+        temp_file.replace(cache_file)
+        self.evict(game_number=game_number)
+
+    @staticmethod
+    def _modified(cache_file: Path) -> Optional[float]:
+        try:
+            return cache_file.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def evict(self, game_number: Optional[int] = None) -> None:
+        if game_number is None:
+            folders = [x for x in self.folder.glob("*") if x.is_dir()]
+        else:
+            folders = [self.folder / str(game_number)]
+        oldest = time.time() - self.max_age
+        with self._lock:
+            for folder in folders:
+                entries = sorted(folder.glob("*.json"), reverse=True)
+                for index, cache_file in enumerate(entries):
+                    if index < self.max_entries:
+                        modified = self._modified(cache_file)
+                        if modified is None or modified >= oldest:
+                            continue
+                    LOGGER.debug(f"Evicting cached response {folder.name}/{cache_file.name}")
+                    cache_file.unlink(missing_ok=True)
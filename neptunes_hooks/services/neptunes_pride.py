@@ -1,61 +1,164 @@
-__all__ = ["NeptunesPride"]
+__all__ = ["NeptunesPride", "parse_stats"]
 
+import json
 import logging
-from typing import Any, Dict
+import time
+from typing import IO, Any, Dict, Optional
 
+from requests import Session
+
+try:
+    import ijson
+except ModuleNotFoundError:
+    ijson = None
+
+from neptunes_hooks.metrics import API_FETCH_SECONDS, PARSE_SECONDS
 from neptunes_hooks.models import PlayerStats, Stats
-from neptunes_hooks.services._base import Service
+from neptunes_hooks.services._base import NEPTUNES_PRIDE_ROOT, Service
+from neptunes_hooks.services.cache import ResponseCache
 
 LOGGER = logging.getLogger(__name__)
+GAME_FIELDS = {"name", "tick", "tick_fragment", "tick_rate", "paused", "game_over"}
+PLAYER_FIELDS = {
+    "alias",
+    "conceded",
+    "total_stars",
+    "total_strength",
+    "total_economy",
+    "total_industry",
+    "total_science",
+}
+SCALAR_EVENTS = {"string", "number", "boolean", "null"}
+
+
+def project_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    content = {key: value for key, value in data.items() if key in GAME_FIELDS}
+    content["players"] = {
+        uid: {
+            **{key: value for key, value in player.items() if key in PLAYER_FIELDS},
+            "tech": {key: {"level": value["level"]} for key, value in player["tech"].items()},
+        }
+        for uid, player in data["players"].items()
+    }
+    return content
+
+
+def load_payload(stream: IO[bytes]) -> Dict[str, Any]:
+    if ijson is None:
+        return project_payload(json.load(stream))
+
+    content = {"players": {}}
+    try:
+        for prefix, event, value in ijson.parse(stream, use_float=True):
+            if event not in SCALAR_EVENTS:
+                continue
+            if prefix in GAME_FIELDS:
+                content[prefix] = value
+                continue
+            path = prefix.split(".")
+            if path[0] != "players" or len(path) < 3:
+                continue
+            player = content["players"].setdefault(path[1], {"tech": {}})
+            if len(path) == 3 and path[2] in PLAYER_FIELDS:
+                player[path[2]] = value
+            elif len(path) == 5 and path[2] == "tech" and path[4] == "level":
+                player["tech"][path[3]] = {"level": value}
+    except ijson.JSONError as err:
+        raise ValueError(str(err)) from err
+    return content
+
+
+def parse_stats(data: Dict[str, Any]) -> Stats:
+    players = []
+    for player_data in data["players"].values():
+        players.append(
+            PlayerStats(
+                username=player_data["alias"],
+                active=player_data["conceded"] == 0,
+                stars=player_data["total_stars"],
+                ships=player_data["total_strength"],
+                economy=player_data["total_economy"],
+                economy_per_turn=int(
+                    player_data["total_economy"] * 10.0
+                    + player_data["tech"]["banking"]["level"] * 75.0,
+                ),
+                industry=player_data["total_industry"],
+                industry_per_turn=int(
+                    player_data["total_industry"]
+                    * (player_data["tech"]["manufacturing"]["level"] + 5.0)
+                    / 2.0,
+                ),
+                science=player_data["total_science"],
+                scanning=player_data["tech"]["scanning"]["level"],
+                hyperspace_range=player_data["tech"]["propulsion"]["level"],
+                terraforming=player_data["tech"]["terraforming"]["level"],
+                experimentation=player_data["tech"]["research"]["level"],
+                weapons=player_data["tech"]["weapons"]["level"],
+                banking=player_data["tech"]["banking"]["level"],
+                manufacturing=player_data["tech"]["manufacturing"]["level"],
+            ),
+        )
+    return Stats(
+        title=data["name"],
+        tick=data["tick"],
+        tick_fragment=data.get("tick_fragment", 0.0),
+        minutes_per_tick=data.get("tick_rate", 60),
+        paused=data.get("paused", False),
+        active=data["game_over"] == 0,
+        players=players,
+    )
 
 
 class NeptunesPride(Service):
-    def __init__(self, game_number: int, code: str, timeout: int = 30):
-        super().__init__(url="https://np.ironhelmet.com/api", timeout=timeout)
+    def __init__(
+        self,
+        game_number: int,
+        code: str,
+        timeout: int = 30,
+        session: Optional[Session] = None,
+        cache: Optional[ResponseCache] = None,
+        offline: bool = False,
+    ):
+        super().__init__(url=f"{NEPTUNES_PRIDE_ROOT}api", timeout=timeout, session=session)
         self.game_number = game_number
         self.code = code
+        self.cache = cache
+        self.offline = offline
+        self._latest: Optional[Stats] = None
+        self._expires = 0.0
+
+    def pull_data(self, tick: Optional[int] = None) -> Stats:
+        if tick is not None or self.offline:
+            return self._replay(tick=tick)
+        if self._latest and time.time() < self._expires:
+            LOGGER.debug(f"[{self.game_number}] Using cached tick {self._latest.tick}")
+            return self._latest
 
-    def pull_data(self) -> Stats:
-        data = self._get_stats()
+        with API_FETCH_SECONDS.time(game=self.game_number):
+            data = self._get_stats()
         if not data:
             return {}
-        players = []
-        for player_data in data["players"].values():
-            players.append(
-                PlayerStats(
-                    username=player_data["alias"],
-                    active=player_data["conceded"] == 0,
-                    stars=player_data["total_stars"],
-                    ships=player_data["total_strength"],
-                    economy=player_data["total_economy"],
-                    economy_per_turn=int(
-                        player_data["total_economy"] * 10.0
-                        + player_data["tech"]["banking"]["level"] * 75.0,
-                    ),
-                    industry=player_data["total_industry"],
-                    industry_per_turn=int(
-                        player_data["total_industry"]
-                        * (player_data["tech"]["manufacturing"]["level"] + 5.0)
-                        / 2.0,
-                    ),
-                    science=player_data["total_science"],
-                    scanning=player_data["tech"]["scanning"]["level"],
-                    hyperspace_range=player_data["tech"]["propulsion"]["level"],
-                    terraforming=player_data["tech"]["terraforming"]["level"],
-                    experimentation=player_data["tech"]["research"]["level"],
-                    weapons=player_data["tech"]["weapons"]["level"],
-                    banking=player_data["tech"]["banking"]["level"],
-                    manufacturing=player_data["tech"]["manufacturing"]["level"],
-                ),
-            )
-        return Stats(
-            title=data["name"],
-            tick=data["tick"],
-            active=data["game_over"] == 0,
-            players=players,
+        with PARSE_SECONDS.time(game=self.game_number):
+            stats = parse_stats(data)
+        if self.cache:
+            self.cache.put(game_number=self.game_number, tick=stats.tick, content=data)
+        self._latest = stats
+        self._expires = (
+            0.0
+            if stats.paused
+            else time.time() + (1 - stats.tick_fragment) * stats.minutes_per_tick * 60
         )
+        return stats
+
+    def _replay(self, tick: Optional[int] = None) -> Stats:
+        data = self.cache.get(game_number=self.game_number, tick=tick) if self.cache else None
+        if not data:
+            LOGGER.warning(f"[{self.game_number}] No cached response for tick {tick}")
+            return {}
+        return parse_stats(data)
 
     def _get_stats(self) -> Dict[str, Any]:
-        return self._perform_post_data_request(
-            body={"api_version": "0.1", "game_number": self.game_number, "code": self.code},
+        return self._perform_post_request(
+            data={"api_version": "0.1", "game_number": self.game_number, "code": self.code},
+            parser=load_payload,
         )
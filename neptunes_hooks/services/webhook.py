@@ -0,0 +1,23 @@
+__all__ = ["Webhook"]
+
+import logging
+from typing import IO, Any, Dict, Optional
+
+from requests import Session
+
+from neptunes_hooks.services._base import Service
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _discard(stream: IO[bytes]) -> Dict[str, Any]:
+    stream.read()
+    return {}
+
+
+class Webhook(Service):
+    def __init__(self, url: str, timeout: int = 30, session: Optional[Session] = None):
+        super().__init__(url=url, timeout=timeout, session=session)
+
+    def post(self, body: bytes) -> None:
+        self._perform_post_request(data=body, parser=_discard)
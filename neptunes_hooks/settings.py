@@ -1,17 +1,21 @@
-__all__ = ["Settings"]
+__all__ = ["Settings", "SettingsWatcher"]
 
+import hashlib
+import logging
 from pathlib import Path
-from typing import ClassVar, List
+from threading import Lock
+from typing import ClassVar, Dict, List, Optional, Tuple, Union
 
 try:
     import tomllib as tomlreader  # Python >= 3.11
 except ModuleNotFoundError:
     import tomli as tomlreader  # Python < 3.11
-import tomli_w as tomlwriter
-from pydantic import BaseModel, Extra, Field
+from pydantic import BaseModel, Extra, Field, validator
 
 from neptunes_hooks import get_config_root
 
+LOGGER = logging.getLogger(__name__)
+
 
 class SettingsModel(BaseModel):
     class Config:
@@ -25,11 +29,41 @@ class NeptunesPrideSettings(SettingsModel):
     game_number: int = 0
     api_code: str = ""
     tick_rate: int = 12
-    last_tick: int = 0
+    last_tick: int = Field(default=0, exclude=True)
+
+
+class HttpSettings(SettingsModel):
+    pool_size: int = 10
+    retries: int = 3
+    backoff_factor: float = 0.5
+
+
+class CacheSettings(SettingsModel):
+    max_entries: int = 1000
+    max_age_days: int = 30
+
+
+class LeaderboardSettings(SettingsModel):
+    top: int = 3
+    weights: List[int] = Field(default_factory=lambda: [3, 2, 1])
 
 
 class WebhookSettings(SettingsModel):
-    microsoft_teams: str = ""
+    microsoft_teams: List[str] = Field(default_factory=list)
+    teams_adaptive: List[str] = Field(default_factory=list)
+    discord: List[str] = Field(default_factory=list)
+    slack: List[str] = Field(default_factory=list)
+    generic: List[str] = Field(default_factory=list)
+
+    @validator("*", pre=True)
+    def split_urls(cls, value: Union[str, List[str]]) -> List[str]:  # noqa: N805
+        if isinstance(value, str):
+            return [value] if value else []
+        return value
+
+    @property
+    def destinations(self) -> Dict[str, List[str]]:
+        return {key: value for key, value in self.dict().items() if value}
 
 
 class PlayerSettings(SettingsModel):
@@ -39,28 +73,98 @@ class PlayerSettings(SettingsModel):
 
 
 class _Settings(SettingsModel):
-    FILENAME: ClassVar[Path] = get_config_root() / "settings.toml"
+    _filename: ClassVar[Optional[Path]] = None
     _instance: ClassVar["_Settings"] = None
     neptunes_pride: NeptunesPrideSettings = NeptunesPrideSettings()
+    games: List[NeptunesPrideSettings] = Field(default_factory=list)
+    http: HttpSettings = HttpSettings()
+    cache: CacheSettings = CacheSettings()
+    leaderboard: LeaderboardSettings = LeaderboardSettings()
     webhooks: WebhookSettings = WebhookSettings()
     players: List[PlayerSettings] = Field(default_factory=list)
 
+    @property
+    def all_games(self) -> List[NeptunesPrideSettings]:
+        games = [self.neptunes_pride, *self.games]
+        return [x for x in games if x.game_number]
+
+    @classmethod
+    def filename(cls) -> Path:
+        if cls._filename is None:
+            cls._filename = get_config_root() / "settings.toml"
+        return cls._filename
+
+    @classmethod
+    def current(cls) -> "_Settings":
+        if cls._instance is None:
+            cls._instance = cls.load()
+        return cls._instance
+
+    @classmethod
+    def replace(cls, settings: "_Settings") -> None:
+        cls._instance = settings
+
     @classmethod
     def load(cls) -> "_Settings":
-        if not cls.FILENAME.exists():
+        if not cls.filename().exists():
             _Settings().save()
-        with cls.FILENAME.open("rb") as stream:
-            content = tomlreader.load(stream)
-        return _Settings(**content)
+        return cls.parse(cls.filename().read_bytes())
+
+    @classmethod
+    def parse(cls, content: bytes) -> "_Settings":
+        return _Settings(**tomlreader.loads(content.decode("UTF-8")))
 
     def save(self) -> "_Settings":
-        with self.FILENAME.open("wb") as stream:
+        import tomli_w as tomlwriter
+
+        with self.filename().open("wb") as stream:
             content = self.dict(by_alias=False)
             tomlwriter.dump(content, stream)
         return self
 
 
 def Settings() -> _Settings:  # noqa: N802
-    if _Settings._instance is None:
-        _Settings._instance = _Settings.load()
-    return _Settings._instance
+    return _Settings.current()
+
+
+class SettingsWatcher:
+    def __init__(self):
+        self._lock = Lock()
+        self._signature = self._stat()
+        self._digest = self._hash(_Settings.filename().read_bytes()) if self._signature else None
+
+    @staticmethod
+    def _stat() -> Optional[Tuple[int, int]]:
+        try:
+            stat = _Settings.filename().stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    @property
+    def settings(self) -> _Settings:
+        return Settings()
+
+    def check(self) -> bool:
+        with self._lock:
+            signature = self._stat()
+            if signature is None or signature == self._signature:
+                return False
+            self._signature = signature
+            content = _Settings.filename().read_bytes()
+            digest = self._hash(content)
+            if digest == self._digest:
+                return False
+            try:
+                settings = _Settings.parse(content)
+            except ValueError as err:
+                LOGGER.error(f"Ignoring invalid settings in `{_Settings.filename()}`: {err}")
+                return False
+            self._digest = digest
+            _Settings.replace(settings)
+            LOGGER.info("Reloaded settings")
+            return True
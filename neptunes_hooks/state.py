@@ -0,0 +1,107 @@
+__all__ = ["StateStore"]
+
+import json
+import logging
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional
+
+from neptunes_hooks import get_data_root
+from neptunes_hooks.lock import RunLock
+
+LOGGER = logging.getLogger(__name__)
+
+
+class StateStore:
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or get_data_root() / "state.json"
+        self._lock = Lock()
+        self._file_lock = RunLock(path=self.path.with_suffix(".lock"))
+        self._last_ticks: Dict[str, int] = {}
+        self._players: List[str] = []
+        self._next_polls: Dict[str, float] = {}
+        self._changed_ticks: Dict[str, int] = {}
+        self._changed_polls: Dict[str, float] = {}
+        self._new_players: List[str] = []
+        self._load(self._read())
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with self.path.open("r", encoding="UTF-8") as stream:
+                return json.load(stream)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            LOGGER.warning(f"Ignoring unreadable state file `{self.path}`")
+            return {}
+
+    def _load(self, content: Dict[str, Any]) -> None:
+        self._last_ticks = content.get("last_ticks", {})
+        self._players = content.get("players", [])
+        self._next_polls = content.get("next_polls", {})
+
+    @property
+    def _dirty(self) -> bool:
+        return bool(self._changed_ticks or self._changed_polls or self._new_players)
+
+    def last_tick(self, game_number: int, default: int = 0) -> int:
+        with self._lock:
+            return self._last_ticks.get(str(game_number), default)
+
+    def set_last_tick(self, game_number: int, tick: int) -> None:
+        with self._lock:
+            if self._last_ticks.get(str(game_number)) != tick:
+                self._last_ticks[str(game_number)] = tick
+                self._changed_ticks[str(game_number)] = tick
+
+    def next_poll(self, game_number: int, default: float = 0.0) -> float:
+        with self._lock:
+            return self._next_polls.get(str(game_number), default)
+
+    def set_next_poll(self, game_number: int, timestamp: float) -> None:
+        with self._lock:
+            if self._next_polls.get(str(game_number)) != timestamp:
+                self._next_polls[str(game_number)] = timestamp
+                self._changed_polls[str(game_number)] = timestamp
+
+    @property
+    def players(self) -> List[str]:
+        with self._lock:
+            return list(self._players)
+
+    def add_players(self, usernames: Iterable[str]) -> List[str]:
+        with self._lock:
+            known = set(self._players)
+            new_players = sorted({x for x in usernames if x and x not in known})
+            if new_players:
+                self._players.extend(new_players)
+                self._new_players.extend(new_players)
+            return new_players
+
+    def flush(self) -> bool:
+        with self._lock:
+            if not self._dirty:
+                return False
+            self._file_lock.acquire(blocking=True)
+            try:
+                current = self._read()
+                players = current.get("players", [])
+                content = {
+                    "last_ticks": {**current.get("last_ticks", {}), **self._changed_ticks},
+                    "players": players + [x for x in self._new_players if x not in players],
+                    "next_polls": {**current.get("next_polls", {}), **self._changed_polls},
+                }
+                temp_file = self.path.with_suffix(".tmp")
+                with temp_file.open("w", encoding="UTF-8") as stream:
+                    json.dump(content, stream, indent=2)
+                    stream.flush()
+                    os.fsync(stream.fileno())
+                temp_file.replace(self.path)
+            finally:
+                self._file_lock.release()
+            self._load(content)
+            self._changed_ticks.clear()
+            self._changed_polls.clear()
+            self._new_players.clear()
+            return True
@@ -0,0 +1,144 @@
+__all__ = ["Supervisor", "balance"]
+
+import logging
+import multiprocessing
+import signal
+import time
+from threading import Event
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from neptunes_hooks.settings import SettingsWatcher
+
+LOGGER = logging.getLogger(__name__)
+
+
+def balance(games: List[int], assignments: Dict[int, Set[int]]) -> Dict[int, Set[int]]:
+    wanted = set(games)
+    result = {slot: {x for x in owned if x in wanted} for slot, owned in assignments.items()}
+    assigned = {x for owned in result.values() for x in owned}
+    for game in sorted(wanted - assigned):
+        min(result.values(), key=len).add(game)
+    while result:
+        largest = max(result.values(), key=len)
+        smallest = min(result.values(), key=len)
+        if len(largest) - len(smallest) <= 1:
+            break
+        game = max(largest)
+        largest.remove(game)
+        smallest.add(game)
+    return result
+
+
+class Supervisor:
+    def __init__(
+        self,
+        target: Callable[[List[int]], None],
+        processes: int,
+        watcher: Optional[SettingsWatcher] = None,
+        min_backoff: float = 1,
+        max_backoff: float = 5 * 60,
+        stable_after: float = 60,
+        shutdown_timeout: float = 30,
+    ):
+        self.target = target
+        self.processes = max(1, processes)
+        self.watcher = watcher
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.stable_after = stable_after
+        self.shutdown_timeout = shutdown_timeout
+        self.assignments: Dict[int, Set[int]] = {}
+        self._workers: Dict[int, multiprocessing.Process] = {}
+        self._started: Dict[int, float] = {}
+        self._failures: Dict[int, int] = {}
+        self._restart_at: Dict[int, float] = {}
+        self._stop = Event()
+
+    def _start(self, slot: int) -> None:
+        games = sorted(self.assignments[slot])
+        process = multiprocessing.Process(
+            target=self.target,
+            args=(games,),
+            name=f"neptunes-hooks-{slot}",
+        )
+        process.start()
+        self._workers[slot] = process
+        self._started[slot] = time.monotonic()
+        LOGGER.info(f"Started worker {slot} (pid {process.pid}) for games {games}")
+
+    def _halt(self, slot: int) -> None:
+        process = self._workers.pop(slot, None)
+        if process is None:
+            return
+        if process.is_alive():
+            process.terminate()
+        process.join(self.shutdown_timeout)
+        if process.is_alive():
+            LOGGER.warning(f"Worker {slot} didn't stop in time, killing it")
+            process.kill()
+            process.join()
+
+    def rebalance(self, games: List[int]) -> None:
+        slots = min(self.processes, len(games))
+        assignments = {x: set(self.assignments.get(x, ())) for x in range(slots)}
+        assignments = balance(games=games, assignments=assignments)
+        for slot in set(self.assignments) | set(assignments):
+            if self.assignments.get(slot) == assignments.get(slot):
+                continue
+            self._halt(slot)
+            self._failures.pop(slot, None)
+            self._restart_at[slot] = 0.0
+            if slot in assignments:
+                LOGGER.info(f"Assigning games {sorted(assignments[slot])} to worker {slot}")
+        self.assignments = assignments
+        self._restart_at = {x: y for x, y in self._restart_at.items() if x in assignments}
+
+    def _reap(self, slot: int, process: multiprocessing.Process) -> None:
+        del self._workers[slot]
+        if process.exitcode == 0:
+            LOGGER.info(f"Worker {slot} finished games {sorted(self.assignments[slot])}")
+            del self.assignments[slot]
+            return
+        if time.monotonic() - self._started[slot] >= self.stable_after:
+            self._failures[slot] = 0
+        failures = self._failures.get(slot, 0) + 1
+        self._failures[slot] = failures
+        delay = min(self.min_backoff * 2 ** (failures - 1), self.max_backoff)
+        self._restart_at[slot] = time.monotonic() + delay
+        LOGGER.error(f"Worker {slot} exited with code {process.exitcode}, restarting in {delay}s")
+
+    def stop(self, *_: Any) -> None:
+        self._stop.set()
+
+    def run(self, games: List[int]) -> None:
+        previous = signal.signal(signal.SIGTERM, self.stop)
+        self.rebalance(games)
+        try:
+            while self.assignments and not self._stop.is_set():
+                if self.watcher and self.watcher.check():
+                    finished = set(games) - {
+                        x for owned in self.assignments.values() for x in owned
+                    }
+                    games = [
+                        x.game_number
+                        for x in self.watcher.settings.all_games
+                        if x.game_number not in finished
+                    ]
+                    self.rebalance(games)
+
+                for slot, process in list(self._workers.items()):
+                    if not process.is_alive():
+                        self._reap(slot, process)
+                now = time.monotonic()
+                for slot, restart_at in self._restart_at.items():
+                    if slot in self.assignments and slot not in self._workers and restart_at <= now:
+                        self._start(slot)
+                self._stop.wait(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if self._workers:
+                LOGGER.info("Stopping workers")
+            for slot in list(self._workers):
+                self._halt(slot)
+            signal.signal(signal.SIGTERM, previous)
@@ -1,10 +1,17 @@
-__all__ = ["parse_player_stats", "parse_team_stats"]
+__all__ = [
+    "build_leaderboards",
+    "generate_teams",
+    "parse_player_stats",
+    "parse_team_stats",
+    "rank_player_stats",
+    "rank_team_stats",
+]
 
+import heapq
 import logging
-from dataclasses import asdict
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from neptunes_hooks.models import Stats, TeamStats
+from neptunes_hooks.models import Ranking, Standings, StatColumns, Stats, TeamStats
 from neptunes_hooks.settings import PlayerSettings
 
 LOGGER = logging.getLogger(__name__)
@@ -24,6 +31,23 @@
     "banking",
     "manufacturing",
 ]
+RANK_WEIGHTS = (3, 2, 1)
+TEAM_AGGREGATES = {
+    "stars": sum,
+    "ships": sum,
+    "economy": sum,
+    "economy_per_turn": sum,
+    "industry": sum,
+    "industry_per_turn": sum,
+    "science": sum,
+    "scanning": max,
+    "hyperspace_range": max,
+    "terraforming": max,
+    "experimentation": max,
+    "weapons": max,
+    "banking": max,
+    "manufacturing": max,
+}
 
 
 def _calculate_overall(data: Dict[str, List[str]]) -> List[str]:
@@ -45,90 +69,177 @@ def _calculate_overall(data: Dict[str, List[str]]) -> List[str]:
     return leading
 
 
-def parse_player_stats(
+def _build_columns(rows: List[Any]) -> StatColumns:
+    return StatColumns.from_rows(rows, stats=STAT_NAMES)
+
+
+def _calculate_leaders(columns: StatColumns) -> Dict[str, Tuple[int, List[int]]]:
+    leaders = {}
+    for stat, column in columns.items():
+        max_value = max(column, default=-1)
+        leaders[stat] = (max_value, [i for i, x in enumerate(column) if x == max_value])
+    return leaders
+
+
+def _stat_title(index: int, stat: str, value: int) -> str:
+    return f"{stat} ({value:,})" if index < 7 else f"{stat} (Lvl {value:,})"
+
+
+def _player_title(username: str, settings: Optional[PlayerSettings]) -> str:
+    player_title = username
+    if settings and settings.name:
+        player_title += f" ({settings.name})"
+    if settings and settings.team:
+        player_title += f" [{settings.team}]"
+    return player_title
+
+
+def _player_columns(
     stats: Stats,
     players: List[PlayerSettings],
+) -> Tuple[StatColumns, List[str]]:
+    lookup = {}
+    for player in players:
+        lookup.setdefault(player.username, player)
+    active = [x for x in stats.players if x.active]
+    titles = [_player_title(x.username, lookup.get(x.username)) for x in active]
+    return _build_columns(active), titles
+
+
+def _team_columns(teams: List[TeamStats]) -> Tuple[StatColumns, List[str]]:
+    active = [x for x in teams if x.active]
+    return _build_columns(active), [x.name for x in active]
+
+
+def _calculate_leaderboard(
+    columns: StatColumns,
+    titles: List[str],
 ) -> Tuple[Dict[str, List[str]], List[str]]:
-    player_stats = {}
+    leaders = _calculate_leaders(columns)
+    leaderboard = {}
     for index, stat in enumerate(STAT_NAMES):
-        max_value = -1
-        max_players = []
-        for player in [x for x in stats.players if x.active]:
-            player_data = asdict(player)
-            if player_data[stat] > max_value:
-                max_value = player_data[stat]
-                max_players = [player.username]
-            elif player_data[stat] == max_value:
-                max_players.append(player.username)
-
-        player_titles = []
-        for username in max_players:
-            player_title = username
-            if name := safe_get([x.name for x in players if x.username == username]):
-                player_title += f" ({name})"
-            if team_name := safe_get([x.team for x in players if x.username == username]):
-                player_title += f" [{team_name}]"
-            player_titles.append(player_title)
-
-        stat_title = f"{stat} ({max_value:,})" if index < 7 else f"{stat} (Lvl {max_value:,})"
-        player_stats[stat_title] = player_titles
-
-    return player_stats, _calculate_overall(player_stats)
-
-
-def safe_get(data: List[Any], default: Optional[str] = None) -> Optional[Any]:
-    return next(iter(data), default)
-
-
-def _generate_teams(stats: Stats, players: List[PlayerSettings]) -> List[TeamStats]:
-    team_list = []
-    for username in [x.username for x in players]:
-        player = safe_get([x for x in stats.players if x.username == username])
-        if not player:
-            continue
-
-        team_name = safe_get([x.team for x in players if x.username == username]) or "~"
-        team = safe_get([x for x in team_list if x.name == team_name]) or TeamStats(name=team_name)
-        team.active = team.active or player.active
-        team.stars += player.stars
-        team.ships += player.ships
-        team.economy += player.economy
-        team.economy_per_turn += player.economy_per_turn
-        team.industry += player.industry
-        team.industry_per_turn += player.industry_per_turn
-        team.science += player.science
-        team.scanning = max(team.scanning, player.scanning)
-        team.hyperspace_range = max(team.hyperspace_range, player.hyperspace_range)
-        team.terraforming = max(team.terraforming, player.terraforming)
-        team.experimentation = max(team.experimentation, player.experimentation)
-        team.weapons = max(team.weapons, player.weapons)
-        team.banking = max(team.banking, player.banking)
-        team.manufacturing = max(team.manufacturing, player.manufacturing)
-    if len({x.name for x in team_list}) >= 1:
-        return team_list
-    return {}
+        max_value, indexes = leaders[stat]
+        leaderboard[_stat_title(index, stat, max_value)] = [titles[i] for i in indexes]
+    return leaderboard, _calculate_overall(leaderboard)
+
+
+def parse_player_stats(
+    stats: Stats,
+    players: List[PlayerSettings],
+) -> Tuple[Dict[str, List[str]], List[str]]:
+    return _calculate_leaderboard(*_player_columns(stats, players))
+
+
+def _top_k(column: Sequence[int], k: int) -> List[Tuple[int, int, int]]:
+    if not column or k <= 0:
+        return []
+    threshold = column[heapq.nlargest(k, range(len(column)), key=column.__getitem__)[-1]]
+    indexes = sorted((i for i, x in enumerate(column) if x >= threshold), key=lambda i: -column[i])
+    ranked = []
+    for position, index in enumerate(indexes, start=1):
+        value = column[index]
+        rank = ranked[-1][0] if ranked and ranked[-1][1] == value else position
+        ranked.append((rank, value, index))
+    return [x for x in ranked if x[0] <= k]
+
+
+def _calculate_standings(
+    columns: StatColumns,
+    titles: List[str],
+    top: int,
+    weights: Sequence[int],
+) -> Standings:
+    standings = Standings()
+    scores = [0] * len(columns)
+    for stat, column in columns.items():
+        ranked = _top_k(column, top)
+        standings.stats[stat] = [Ranking(rank=r, name=titles[i], value=v) for r, v, i in ranked]
+        for rank, _, index in ranked:
+            if rank <= len(weights):
+                scores[index] += weights[rank - 1]
+    standings.overall = [
+        Ranking(rank=r, name=titles[i], value=v) for r, v, i in _top_k(scores, top) if v > 0
+    ]
+    return standings
+
+
+def rank_player_stats(
+    stats: Stats,
+    players: List[PlayerSettings],
+    top: int = 3,
+    weights: Sequence[int] = RANK_WEIGHTS,
+) -> Standings:
+    columns, titles = _player_columns(stats, players)
+    return _calculate_standings(columns=columns, titles=titles, top=top, weights=weights)
+
+
+def rank_team_stats(
+    stats: Stats,
+    players: List[PlayerSettings],
+    top: int = 3,
+    weights: Sequence[int] = RANK_WEIGHTS,
+) -> Optional[Standings]:
+    teams = generate_teams(stats, players)
+    if not teams:
+        return None
+    columns, titles = _team_columns(teams)
+    return _calculate_standings(columns=columns, titles=titles, top=top, weights=weights)
+
+
+def generate_teams(stats: Stats, players: List[PlayerSettings]) -> List[TeamStats]:
+    roster = {}
+    for player in players:
+        roster.setdefault(player.username, player.team)
+    members = {}
+    for player in stats.players:
+        if team := roster.get(player.username):
+            members.setdefault(team, []).append(player)
+
+    return [
+        TeamStats(
+            name=name,
+            active=any(x.active for x in team),
+            **{
+                stat: func(getattr(x, stat) for x in team) for stat, func in TEAM_AGGREGATES.items()
+            },
+        )
+        for name, team in members.items()
+    ]
 
 
 def parse_team_stats(
     stats: Stats,
     players: List[PlayerSettings],
 ) -> Optional[Tuple[Dict[str, List[str]], List[str]]]:
-    teams = _generate_teams(stats, players)
+    teams = generate_teams(stats, players)
     if not teams:
         return None
+    return _calculate_leaderboard(*_team_columns(teams))
 
-    team_stats = {}
-    for index, stat in enumerate(STAT_NAMES):
-        max_value = -1
-        max_teams = []
-        for team in [x for x in teams if x.active]:
-            team_data = asdict(team)
-            if team_data[stat] > max_value:
-                max_value = team_data[stat]
-                max_teams = [team.name]
-            elif team_data[stat] == max_value:
-                max_teams.append(team.name)
-        stat_title = f"{stat} ({max_value:,})" if index < 7 else f"{stat} (Lvl {max_value:,})"
-        team_stats[stat_title] = max_teams
-
-    return team_stats, _calculate_overall(team_stats)
+
+def build_leaderboards(
+    stats: Stats,
+    players: List[PlayerSettings],
+    teams: Optional[List[TeamStats]] = None,
+    top: int = 3,
+    weights: Sequence[int] = RANK_WEIGHTS,
+) -> Tuple[
+    Tuple[Dict[str, List[str]], List[str]],
+    Optional[Tuple[Dict[str, List[str]], List[str]]],
+    Standings,
+    Optional[Standings],
+]:
+    columns, titles = _player_columns(stats, players)
+    player_stats = _calculate_leaderboard(columns, titles)
+    player_standings = _calculate_standings(columns, titles, top=top, weights=weights)
+    if teams is None:
+        teams = generate_teams(stats, players)
+    if not teams:
+        return player_stats, None, player_standings, None
+    columns, titles = _team_columns(teams)
+    return (
+        player_stats,
+        _calculate_leaderboard(columns, titles),
+        player_standings,
+        _calculate_standings(columns, titles, top=top, weights=weights),
+    )
@@ -0,0 +1,33 @@
+import os
+import time
+from pathlib import Path
+
+from neptunes_hooks.services.cache import ResponseCache
+
+
+def test_put_caps_entries_per_game(tmp_path: Path) -> None:
+    cache = ResponseCache(folder=tmp_path, max_entries=2)
+    for tick in range(1, 5):
+        cache.put(game_number=1, tick=tick, content={"tick": tick})
+    cache.put(game_number=2, tick=1, content={"tick": 1})
+
+    assert cache.ticks(1) == [3, 4]
+    assert cache.ticks(2) == [1]
+    assert cache.get(1) == {"tick": 4}
+
+
+def test_evict_removes_old_entries(tmp_path: Path) -> None:
+    cache = ResponseCache(folder=tmp_path, max_age=60)
+    cache.put(game_number=1, tick=1, content={})
+    cache.put(game_number=2, tick=1, content={})
+    cache.put(game_number=2, tick=2, content={})
+    expired = time.time() - 120
+    for cache_file in (tmp_path / "1" / "000001.json", tmp_path / "2" / "000001.json"):
+        os.utime(cache_file, (expired, expired))
+
+    cache.evict(game_number=2)
+    assert cache.ticks(1) == [1]
+    assert cache.ticks(2) == [2]
+
+    cache.evict()
+    assert cache.ticks(1) == []
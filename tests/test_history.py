@@ -0,0 +1,95 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from neptunes_hooks.history import COLUMNS, ITEM_SIZE, HistoryStore
+from neptunes_hooks.models import PlayerStats, Stats
+
+
+def make_stats(tick: int, usernames: List[str]) -> Stats:
+    return Stats(
+        title="Test Game",
+        tick=tick,
+        active=True,
+        players=[
+            PlayerStats(username=x, active=True, stars=tick * 10 + i, ships=tick * 100 + i)
+            for i, x in enumerate(usernames)
+        ],
+    )
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> HistoryStore:
+    store = HistoryStore(game_number=1, folder=tmp_path)
+    store.append(make_stats(tick=1, usernames=["alice", "bob"]))
+    store.append(make_stats(tick=2, usernames=["alice", "bob", "carol"]))
+    store.append(make_stats(tick=3, usernames=["alice", "bob", "carol"]))
+    return store
+
+
+def test_append_rejects_old_ticks(store: HistoryStore) -> None:
+    assert not store.append(make_stats(tick=3, usernames=["alice"]))
+    assert not store.append(make_stats(tick=2, usernames=["alice"]))
+    assert len(store) == 8
+    assert store.latest_tick == 3
+
+
+def test_query_tick_range(store: HistoryStore) -> None:
+    result = store.query(start_tick=2, end_tick=3, stats=["stars"])
+
+    assert set(result) == {"tick", "player", "active", "stars"}
+    assert list(result["tick"]) == [2, 2, 2, 3, 3, 3]
+    assert list(result["stars"]) == [20, 21, 22, 30, 31, 32]
+
+
+def test_query_open_ranges(store: HistoryStore) -> None:
+    assert list(store.query(end_tick=1)["tick"]) == [1, 1]
+    assert list(store.query(start_tick=3)["tick"]) == [3, 3, 3]
+    assert not store.query(start_tick=4)["tick"]
+
+
+def test_query_usernames(store: HistoryStore) -> None:
+    result = store.query(usernames=["carol", "unknown"], stats=["ships"])
+
+    assert list(result["tick"]) == [2, 3]
+    assert list(result["ships"]) == [202, 302]
+
+
+def test_load_round_trips(store: HistoryStore) -> None:
+    assert store.load(tick=2) == make_stats(tick=2, usernames=["alice", "bob", "carol"])
+    assert store.load(tick=4) is None
+    assert store.ticks() == [1, 2, 3]
+
+
+def test_reopen_keeps_players(store: HistoryStore, tmp_path: Path) -> None:
+    reopened = HistoryStore(game_number=1, folder=tmp_path)
+
+    assert reopened.title == "Test Game"
+    assert reopened.players == ["alice", "bob", "carol"]
+    assert len(reopened) == len(store)
+
+
+def test_repair_truncates_partial_rows(store: HistoryStore, tmp_path: Path) -> None:
+    folder = store.folder
+    with (folder / "ships.bin").open("rb+") as stream:
+        stream.truncate(7 * ITEM_SIZE)
+    with (folder / "stars.bin").open("ab") as stream:
+        stream.write(b"\x01\x02\x03")
+
+    repaired = HistoryStore(game_number=1, folder=tmp_path)
+
+    assert len(repaired) == 7
+    assert {(folder / f"{x}.bin").stat().st_size for x in COLUMNS} == {7 * ITEM_SIZE}
+    assert list(repaired.query(start_tick=3)["stars"]) == [30, 31]
+    assert repaired.append(make_stats(tick=4, usernames=["alice"]))
+    assert list(repaired.query(start_tick=4)["ships"]) == [400]
+
+
+def test_repair_handles_missing_columns(store: HistoryStore, tmp_path: Path) -> None:
+    (store.folder / "banking.bin").unlink()
+
+    repaired = HistoryStore(game_number=1, folder=tmp_path)
+
+    assert len(repaired) == 0
+    assert repaired.latest_tick == -1
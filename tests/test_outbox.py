@@ -0,0 +1,165 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from neptunes_hooks.outbox import Delivery, Outbox
+from neptunes_hooks.services.exceptions import ServiceError
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr("neptunes_hooks.outbox.time.time", clock)
+    return clock
+
+
+@pytest.fixture()
+def outbox(tmp_path: Path) -> Outbox:
+    return Outbox(folder=tmp_path / "outbox", min_backoff=10, max_backoff=30)
+
+
+def make_delivery(turn: int, url: str = "https://example.com/a", kind: str = "player") -> Delivery:
+    return Delivery(
+        url=url,
+        game_number=1,
+        kind=kind,
+        turn=turn,
+        renderer="generic",
+        body=f"Turn {turn}",
+        report={},
+    )
+
+
+def test_enqueue_coalesces_missed_turns(outbox: Outbox) -> None:
+    outbox.enqueue(make_delivery(turn=1))
+    outbox.enqueue(make_delivery(turn=2))
+    outbox.enqueue(make_delivery(turn=3))
+
+    pending = outbox.pending()
+    assert len(pending) == 1
+    assert pending[0].turn == 3
+    assert pending[0].missed == [1, 2]
+
+
+def test_enqueue_same_turn_replaces_without_missing(outbox: Outbox) -> None:
+    outbox.enqueue(make_delivery(turn=1))
+    outbox.enqueue(make_delivery(turn=1))
+
+    assert [(x.turn, x.missed) for x in outbox.pending()] == [(1, [])]
+
+
+def test_enqueue_keeps_backoff_of_pending_delivery(outbox: Outbox, clock: Clock) -> None:
+    def fail(_: Delivery) -> None:
+        raise ServiceError("down")
+
+    outbox.enqueue(make_delivery(turn=1))
+    outbox.drain(send=fail)
+    outbox.enqueue(make_delivery(turn=2))
+
+    (pending,) = outbox.pending()
+    assert pending.attempts == 1
+    assert pending.next_attempt == clock.now + 10
+
+
+def test_drain_removes_delivered(outbox: Outbox) -> None:
+    sent: List[Delivery] = []
+    outbox.enqueue(make_delivery(turn=1))
+    outbox.enqueue(make_delivery(turn=1, kind="team"))
+
+    assert outbox.drain(send=sent.append) == 2
+    assert [x.kind for x in sent] == ["player", "team"]
+    assert outbox.pending() == []
+
+
+def test_complete_keeps_turn_enqueued_mid_send(outbox: Outbox) -> None:
+    def send(delivery: Delivery) -> None:
+        if delivery.turn == 1:
+            outbox.enqueue(make_delivery(turn=2))
+
+    outbox.enqueue(make_delivery(turn=1))
+
+    assert outbox.drain(send=send) == 1
+    assert [(x.turn, x.missed) for x in outbox.pending()] == [(2, [])]
+
+
+def test_complete_keeps_turns_not_delivered(outbox: Outbox) -> None:
+    def send(delivery: Delivery) -> None:
+        if delivery.turn == 2:
+            outbox.enqueue(make_delivery(turn=3))
+            outbox.enqueue(make_delivery(turn=4))
+
+    outbox.enqueue(make_delivery(turn=1))
+    outbox.enqueue(make_delivery(turn=2))
+
+    assert outbox.drain(send=send) == 1
+    assert [(x.turn, x.missed) for x in outbox.pending()] == [(4, [3])]
+
+
+def test_defer_backs_off_exponentially(outbox: Outbox, clock: Clock) -> None:
+    attempts: List[int] = []
+
+    def fail(delivery: Delivery) -> None:
+        attempts.append(delivery.attempts)
+        raise ServiceError("down")
+
+    outbox.enqueue(make_delivery(turn=1))
+    delays = []
+    for _ in range(4):
+        assert outbox.drain(send=fail) == 0
+        (pending,) = outbox.pending()
+        delays.append(pending.next_attempt - clock.now)
+        assert outbox.drain(send=fail) == 0
+        clock.now = pending.next_attempt
+
+    assert attempts == [0, 1, 2, 3]
+    assert delays == [10, 20, 30, 30]
+
+
+def test_service_error_defers_rest_of_batch(outbox: Outbox, clock: Clock) -> None:
+    sent: List[str] = []
+
+    def send(delivery: Delivery) -> None:
+        if delivery.url.endswith("a"):
+            raise ServiceError("down")
+        sent.append(delivery.kind)
+
+    outbox.enqueue(make_delivery(turn=1, kind="player"))
+    outbox.enqueue(make_delivery(turn=1, kind="team"))
+    outbox.enqueue(make_delivery(turn=1, url="https://example.com/b"))
+
+    assert outbox.drain(send=send) == 1
+    assert sent == ["player"]
+    pending = outbox.pending()
+    assert sorted(x.kind for x in pending) == ["player", "team"]
+    assert all(x.next_attempt == clock.now + 10 for x in pending)
+
+
+def test_unexpected_error_defers_only_that_delivery(outbox: Outbox, clock: Clock) -> None:
+    def send(delivery: Delivery) -> None:
+        if delivery.kind == "player":
+            raise KeyError(delivery.kind)
+
+    outbox.enqueue(make_delivery(turn=1, kind="player"))
+    outbox.enqueue(make_delivery(turn=1, kind="team"))
+
+    assert outbox.drain(send=send) == 1
+    (pending,) = outbox.pending()
+    assert pending.kind == "player"
+    assert pending.next_attempt == clock.now + 10
+
+
+def test_pending_filters_games(tmp_path: Path) -> None:
+    outbox = Outbox(folder=tmp_path, games={2})
+    outbox.enqueue(make_delivery(turn=1))
+
+    assert outbox.pending() == []
+    assert len(Outbox(folder=tmp_path).pending()) == 1
@@ -0,0 +1,69 @@
+import pytest
+
+from neptunes_hooks.models import Stats
+from neptunes_hooks.scheduler import MINUTE, TickScheduler
+from neptunes_hooks.settings import NeptunesPrideSettings
+
+HOUR = 60 * MINUTE
+
+
+@pytest.fixture()
+def game() -> NeptunesPrideSettings:
+    return NeptunesPrideSettings(game_number=1, tick_rate=12)
+
+
+@pytest.fixture()
+def scheduler() -> TickScheduler:
+    return TickScheduler(poll=30, margin=60, min_backoff=60)
+
+
+def make_stats(tick: int, fragment: float = 0.0, paused: bool = False) -> Stats:
+    return Stats(title="Test Game", tick=tick, tick_fragment=fragment, paused=paused, active=True)
+
+
+def test_polls_without_stats(scheduler: TickScheduler, game: NeptunesPrideSettings) -> None:
+    assert scheduler.next_poll(game, None) == 30 * MINUTE
+    assert scheduler.next_poll(game, make_stats(tick=5, paused=True)) == 30 * MINUTE
+
+
+def test_waits_for_next_turn(scheduler: TickScheduler, game: NeptunesPrideSettings) -> None:
+    assert scheduler.next_poll(game, make_stats(tick=5, fragment=0.5)) == 6.5 * HOUR + 60
+
+
+def test_waits_for_every_tick_without_tick_rate(scheduler: TickScheduler) -> None:
+    game = NeptunesPrideSettings(game_number=1, tick_rate=0)
+
+    assert scheduler.next_poll(game, make_stats(tick=5, fragment=0.25)) == 0.75 * HOUR + 60
+
+
+def test_early_poll_waits_remaining(scheduler: TickScheduler, game: NeptunesPrideSettings) -> None:
+    scheduler.next_poll(game, make_stats(tick=10))
+
+    assert scheduler.next_poll(game, make_stats(tick=11, fragment=0.5)) == 0.5 * HOUR + 60
+
+
+def test_missed_tick_backs_off(scheduler: TickScheduler, game: NeptunesPrideSettings) -> None:
+    scheduler.next_poll(game, make_stats(tick=11))
+
+    delays = [scheduler.next_poll(game, make_stats(tick=11, fragment=1.0)) for _ in range(7)]
+
+    assert delays == [60, 120, 240, 480, 960, 1800, 1800]
+
+
+def test_turn_resets_misses(scheduler: TickScheduler, game: NeptunesPrideSettings) -> None:
+    scheduler.next_poll(game, make_stats(tick=11))
+    scheduler.next_poll(game, make_stats(tick=11, fragment=1.0))
+    scheduler.next_poll(game, make_stats(tick=11, fragment=1.0))
+
+    assert scheduler.next_poll(game, make_stats(tick=12)) == 12 * HOUR + 60
+    scheduler.next_poll(game, make_stats(tick=23, fragment=1.0))
+    assert scheduler.next_poll(game, make_stats(tick=23, fragment=1.0)) == 120
+
+
+def test_games_tracked_separately(scheduler: TickScheduler, game: NeptunesPrideSettings) -> None:
+    other = NeptunesPrideSettings(game_number=2, tick_rate=12)
+    scheduler.next_poll(game, make_stats(tick=11))
+    scheduler.next_poll(game, make_stats(tick=11, fragment=1.0))
+
+    assert scheduler.next_poll(other, make_stats(tick=11, fragment=1.0)) == 60
+    assert scheduler.next_poll(game, make_stats(tick=11, fragment=1.0)) == 120
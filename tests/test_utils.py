@@ -0,0 +1,71 @@
+from typing import List
+
+from neptunes_hooks.models import PlayerStats, Stats
+from neptunes_hooks.settings import PlayerSettings
+from neptunes_hooks.utils import (
+    _top_k,
+    build_leaderboards,
+    parse_player_stats,
+    parse_team_stats,
+    rank_player_stats,
+    rank_team_stats,
+)
+
+
+def test_top_k_empty() -> None:
+    assert _top_k([], 3) == []
+    assert _top_k([1, 2], 0) == []
+
+
+def test_top_k_orders_by_value() -> None:
+    assert _top_k([1, 5, 3, 4], 3) == [(1, 5, 1), (2, 4, 3), (3, 3, 2)]
+
+
+def test_top_k_ties_share_rank() -> None:
+    assert _top_k([5, 3, 5, 1], 3) == [(1, 5, 0), (1, 5, 2), (3, 3, 1)]
+
+
+def test_top_k_includes_ties_at_cutoff() -> None:
+    assert _top_k([5, 4, 4, 1], 2) == [(1, 5, 0), (2, 4, 1), (2, 4, 2)]
+    assert _top_k([2, 2, 2, 2], 1) == [(1, 2, 0), (1, 2, 1), (1, 2, 2), (1, 2, 3)]
+
+
+def test_top_k_skips_ranks_after_ties() -> None:
+    assert _top_k([5, 5, 4], 2) == [(1, 5, 0), (1, 5, 1)]
+
+
+def make_stats(stars: List[int]) -> Stats:
+    return Stats(
+        title="Test Game",
+        players=[
+            PlayerStats(username=f"player{i}", active=True, stars=x) for i, x in enumerate(stars)
+        ],
+    )
+
+
+def test_rank_player_stats_ties() -> None:
+    players = [PlayerSettings(username="player0", name="Alice")]
+    standings = rank_player_stats(make_stats([10, 20, 20, 5]), players)
+
+    assert [(x.rank, x.name, x.value) for x in standings.stats["stars"]] == [
+        (1, "player1", 20),
+        (1, "player2", 20),
+        (3, "player0 (Alice)", 10),
+    ]
+
+
+def test_build_leaderboards_matches_separate_calls() -> None:
+    stats = make_stats([10, 20, 20, 5])
+    players = [
+        PlayerSettings(username="player0", team="Red"),
+        PlayerSettings(username="player1", team="Blue"),
+        PlayerSettings(username="player2", team="Red"),
+    ]
+
+    assert build_leaderboards(stats, players, top=2, weights=[5, 1]) == (
+        parse_player_stats(stats, players),
+        parse_team_stats(stats, players),
+        rank_player_stats(stats, players, top=2, weights=[5, 1]),
+        rank_team_stats(stats, players, top=2, weights=[5, 1]),
+    )
+    assert build_leaderboards(stats, players, teams=[])[1:4:2] == (None, None)